@@ -0,0 +1,323 @@
+"""
+Python-side pipeline benchmarks.
+
+Times port extraction, testbench rendering, stimulus loop generation and
+WaveGenCanvas drawing on a synthetic corpus, and records wall time and
+peak Python memory per case as JSON.
+
+Usage:
+    python benchmarks/bench_pipeline.py                       # quick preset
+    python benchmarks/bench_pipeline.py --preset full -o results.json
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --only stimulus --tk stub
+
+The canvas cases use real Tk when a display is available (e.g. under
+xvfb-run) and a stub otherwise; --tk forces either.
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+import contextlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+sys.path.insert(0, BENCH_DIR)
+
+import corpus  # noqa: E402
+from core.generate import STIMULUS_STYLES  # noqa: E402
+
+
+PRESETS = {
+    'quick': {
+        'ports': [1, 10, 100, 1000],
+        'netlist_instances': [1000, 10000],
+        'hierarchy_depth': [10, 100],
+        'stimulus_segments': [1000, 10000],
+        'canvas': [(10, 1000), (100, 1000), (10, 10000)],
+    },
+    'full': {
+        'ports': [1, 10, 100, 1000],
+        'netlist_instances': [1000, 10000, 50000],
+        'hierarchy_depth': [10, 100, 500],
+        'stimulus_segments': [1000, 10000, 100000, 1000000],
+        'canvas': [(10, 1000), (100, 1000), (10, 10000), (100, 10000)],
+    },
+}
+
+TIMING = {'high_time': 10, 'low_time': 10, 'segment_duration': 20}
+
+# The unrolled stimulus loop is quadratic in segments (about 2.5 s at
+# 10k), larger sizes only run the delta and table styles
+UNROLLED_MAX_SEGMENTS = 10000
+
+
+class Case:
+    """
+    One benchmark case: setup() returns the callable that is timed, or a
+    (callable, cleanup) tuple.
+    """
+
+    def __init__(self, case_id, setup):
+        self.case_id = case_id
+        self.setup = setup
+
+
+def _quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _write(work_dir, name, source):
+    path = os.path.join(work_dir, name + ".vhd")
+    with open(path, 'w') as file:
+        file.write(source)
+    return path
+
+
+def _loaded_logic(path):
+    from app_logic import TestbenchLogic
+
+    logic = TestbenchLogic()
+    with _quiet():
+        logic.load_vhdl_file(path)
+    return logic
+
+
+def build_cases(preset, work_dir):
+    """
+    Returns:
+        list: Case objects for the preset
+    """
+    from core.ports import extract, extract_component_names
+
+    cases = []
+
+    for n in preset['ports']:
+        path = _write(work_dir, f"ports_{n}", corpus.make_entity(f"ports_{n}", n, max(1, n // 10)))
+        cases.append(Case(f"parse.entity.ports={n}", lambda p=path: lambda: extract(p)))
+
+    for n in preset['netlist_instances']:
+        path = _write(work_dir, f"netlist_{n}", corpus.make_netlist(f"netlist_{n}", n))
+        size_kib = os.path.getsize(path) // 1024
+
+        def run(p=path):
+            extract(p)
+            extract_component_names(p)
+        cases.append(Case(f"parse.netlist.instances={n}.kib={size_kib}", lambda r=run: r))
+
+    for depth in preset['hierarchy_depth']:
+        top = corpus.write_hierarchy(os.path.join(work_dir, f"hier_{depth}"), depth)
+
+        def run(t=top):
+            # Resolve and parse the whole component chain
+            pending = [t]
+            while pending:
+                path = pending.pop()
+                extract(path)
+                for name in extract_component_names(path):
+                    pending.append(os.path.join(os.path.dirname(path), name + ".vhd"))
+        cases.append(Case(f"parse.hierarchy.depth={depth}", lambda r=run: r))
+
+    for n in preset['ports']:
+        path = os.path.join(work_dir, f"ports_{n}.vhd")
+
+        def setup(p=path):
+            logic = _loaded_logic(p)
+            stimulus = corpus.make_stimulus(logic.num_ports, logic.port_type, 100)
+            timing = dict(TIMING, test_length=100 * TIMING['segment_duration'])
+            tb_path = os.path.join(work_dir, logic.entity_name[1] + ".vhd")
+            return lambda: logic._write_testbench(tb_path, stimulus, timing)
+        cases.append(Case(f"render.testbench.ports={n}.segments=100", setup))
+
+    for n in preset['stimulus_segments']:
+        path = os.path.join(work_dir, "ports_10.vhd")
+        for style in STIMULUS_STYLES:
+            if style == "unrolled" and n > UNROLLED_MAX_SEGMENTS:
+                continue
+
+            def setup(p=path, segments=n, style=style):
+                logic = _loaded_logic(p)
+                logic.stimulus_style = style
+                names, types = logic.num_ports[:4], logic.port_type[:4]
+                logic.num_ports, logic.port_type = names, types
+                stimulus = corpus.make_stimulus(names, types, segments)
+                timing = dict(TIMING, test_length=segments * TIMING['segment_duration'])
+                tb_path = os.path.join(work_dir, "stimulus_tb.vhd")
+
+                def run():
+                    # Fresh placeholders, every repeat renders the full loop
+                    with open(tb_path, 'w') as file:
+                        file.write("XSTIMDECL\nXLOOP")
+                    logic._generate_stimulus_loop(tb_path, stimulus, timing)
+                return run
+            cases.append(Case(f"stimulus.loop.style={style}.ports=4.segments={n}", setup))
+
+    for ports, segments in preset['canvas']:
+        def setup(ports=ports, segments=segments):
+            import tkinter as tk
+            from gui.wave_gen import WaveGenCanvas
+
+            entity = corpus.make_entity("canvas", ports)
+            path = _write(work_dir, f"canvas_{ports}", entity)
+            logic = _loaded_logic(path)
+            stimulus = corpus.make_stimulus(logic.num_ports, logic.port_type, segments)
+            root = tk.Tk()
+            canvas = WaveGenCanvas(root, TIMING['high_time'], TIMING['low_time'],
+                                   segments * TIMING['segment_duration'], TIMING['segment_duration'],
+                                   logic.num_ports, logic.port_type, pixels_per_ns=0.25)
+
+            def run():
+                canvas.set_stimulus(stimulus.get_highlighted_segments(),
+                                    stimulus.get_highlighted_segments_value())
+                canvas.draw_wave()
+                if hasattr(root, "update_idletasks"):
+                    root.update_idletasks()
+            return run, root.destroy
+        cases.append(Case(f"canvas.draw.ports={ports}.segments={segments}", setup))
+
+    return cases
+
+
+def measure(case, repeat):
+    """
+    Time a case and measure its peak Python memory.
+
+    Memory is measured in a separate run because tracemalloc slows
+    allocation heavy code down considerably.
+
+    Returns:
+        dict: time_s_min, time_s_median, peak_kib
+    """
+    with _quiet():
+        func = case.setup()
+        cleanup = None
+        if isinstance(func, tuple):
+            func, cleanup = func
+        try:
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - start)
+
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            if cleanup:
+                cleanup()
+
+    return {
+        'time_s_min': min(times),
+        'time_s_median': statistics.median(times),
+        'peak_kib': peak / 1024,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline, threshold, min_delta_ms=0.5):
+    """
+    Print results next to a baseline.
+
+    Cases faster than min_delta_ms in absolute terms are never flagged,
+    sub-millisecond timings are too noisy for a ratio alone.
+
+    Returns:
+        list: Case ids slower than baseline * threshold
+    """
+    regressions = []
+    print(f"\n{'case':<55}{'base ms':>10}{'now ms':>10}{'ratio':>8}")
+    for case_id, now in results.items():
+        base = baseline.get(case_id)
+        if not base:
+            print(f"{case_id:<55}{'-':>10}{now['time_s_min'] * 1000:>10.2f}{'new':>8}")
+            continue
+        ratio = now['time_s_min'] / base['time_s_min'] if base['time_s_min'] else float('inf')
+        delta_ms = (now['time_s_min'] - base['time_s_min']) * 1000
+        regressed = ratio > threshold and delta_ms > min_delta_ms
+        flag = " !" if regressed else ""
+        print(f"{case_id:<55}{base['time_s_min'] * 1000:>10.2f}{now['time_s_min'] * 1000:>10.2f}"
+              f"{ratio:>8.2f}{flag}")
+        if regressed:
+            regressions.append(case_id)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VVTG pipeline benchmarks")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--only", default=None, help="run cases whose id starts with this prefix")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tk", choices=["auto", "real", "stub"], default="auto")
+    parser.add_argument("-o", "--output", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=None, help="compare against a stored results JSON")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="ignore slowdowns smaller than this in absolute time")
+    args = parser.parse_args()
+
+    use_stub = args.tk == "stub" or (args.tk == "auto" and sys.platform.startswith("linux")
+                                     and not os.environ.get("DISPLAY"))
+    if use_stub:
+        import tkstub
+        tkstub.install()
+
+    work_dir = tempfile.mkdtemp(prefix="vvtg-bench-")
+    results = {}
+    try:
+        with _quiet():
+            cases = build_cases(PRESETS[args.preset], work_dir)
+        for case in cases:
+            if args.only and not case.case_id.startswith(args.only):
+                continue
+            results[case.case_id] = measure(case, args.repeat)
+            r = results[case.case_id]
+            print(f"{case.case_id:<55}{r['time_s_min'] * 1000:>10.2f} ms{r['peak_kib']:>12.0f} KiB")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'preset': args.preset,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'tk': "stub" if use_stub else "real",
+            'commit': _git_commit(),
+            'date': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.2f}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Simulation-runtime benchmark for the generated testbench styles.
+
+Builds the same stimulus in every stimulus style and runs it through the
+installed simulator with every dump setting and clock process variant,
+reporting analyze, elaborate and run times and the dump size. Use the results to pick the
+default stimulus style (core.generate.DEFAULT_STIMULUS_STYLE) or a
+per-project "stimulus_style" in vvtg.json.
+
+Usage:
+    python benchmarks/bench_simulation.py                      # fastest simulator found
+    python benchmarks/bench_simulation.py --simulator ghdl --segments 1000 10000
+    python benchmarks/bench_simulation.py --simulator stub     # no simulator installed
+    python benchmarks/bench_simulation.py -o sim_results.json
+
+The stub simulator only exercises the harness: it scans the sources and
+writes a dump with one line per executed assignment, so its numbers say
+nothing about real simulators.
+"""
+import io
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+sys.path.insert(0, BENCH_DIR)
+
+import corpus  # noqa: E402
+from app_logic import TestbenchLogic  # noqa: E402
+from core.generate import STIMULUS_STYLES, DEFAULT_STIMULUS_STYLE  # noqa: E402
+from core.simulator import SimulatorBackend, select_backend  # noqa: E402
+
+
+TIMING = {'high_time': 10, 'low_time': 10, 'segment_duration': 20}
+
+# Clock process variants, applied to the generated testbench as text
+# replacements. "while" is the template's clk_process, which compares
+# now with TEST_LENGTH every cycle; "counted" runs a precomputed number
+# of cycles instead.
+CLOCK_STYLES = {
+    'while': [],
+    'counted': [
+        ("    constant DATA_CHANGE_TIME  : time := ",
+         "    constant VVTG_CLK_CYCLES   : natural := (TEST_LENGTH - 1 fs) / (CLK_HIGH_TIME + CLK_LOW_TIME) + 1;\n"
+         "    constant DATA_CHANGE_TIME  : time := "),
+        ("        while now < TEST_LENGTH loop\n", "        for vvtg_cycle in 1 to VVTG_CLK_CYCLES loop\n"),
+    ],
+}
+
+
+class StubBackend(SimulatorBackend):
+    """Pure Python stand-in for machines without a simulator."""
+
+    name = "stub"
+    dump_formats = ("vcd",)
+
+    def __init__(self):
+        super().__init__(None, {'version': 'stub'})
+
+    def analyze(self, file_path, library="work", library_paths=(), cwd=None, work_dir=None):
+        path = os.path.join(cwd or "", file_path)
+        with open(path, 'r') as file:
+            tokens = re.findall(r"\w+|[^\s\w]", file.read())
+        with open(os.path.join(cwd or "", "stub-work.txt"), 'a') as file:
+            file.write(f"{file_path} {len(tokens)}\n")
+
+    def elaborate(self, top, library_paths=(), cwd=None):
+        with open(os.path.join(cwd or "", "stub-work.txt"), 'a') as file:
+            file.write(f"elaborate {top}\n")
+
+    def run(self, top, wave_file=None, library_paths=(), cwd=None):
+        with open(os.path.join(cwd or "", top + ".vhd"), 'r') as file:
+            source = file.read()
+        assignments = re.findall(r"^\s*(\w+)<= (.+);$", source, re.MULTILINE)
+        if wave_file:
+            with open(os.path.join(cwd or "", wave_file), 'w') as file:
+                for t, (name, value) in enumerate(assignments):
+                    file.write(f"#{t}\n{value} {name}\n")
+
+    def has_work_library(self, directory):
+        return os.path.exists(os.path.join(directory, "stub-work.txt"))
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def _apply_clock_style(tb_path, clock):
+    with open(tb_path, 'r') as file:
+        source = file.read()
+    for old, new in CLOCK_STYLES[clock]:
+        if old not in source:
+            raise ValueError(f"Clock style '{clock}' does not match the testbench template")
+        source = source.replace(old, new, 1)
+    with open(tb_path, 'w') as file:
+        file.write(source)
+
+
+def run_style(backend, dut_source, segments, style, dump, work_root, clock="while"):
+    """
+    Generate, analyze, elaborate and run one style/dump/clock combination.
+
+    Returns:
+        dict: Stage times in seconds, testbench and dump size in bytes
+    """
+    work_dir = tempfile.mkdtemp(dir=work_root)
+    dut_path = os.path.join(work_dir, "bench_dut.vhd")
+    with open(dut_path, 'w') as file:
+        file.write(dut_source)
+
+    logic = TestbenchLogic()
+    logic.set_simulator(backend)
+    logic.stimulus_style = style
+    logic.load_vhdl_file(dut_path)
+    stimulus = corpus.make_stimulus(logic.num_ports, logic.port_type, segments, density=0.3)
+
+    timing = dict(TIMING, test_length=segments * TIMING['segment_duration'])
+    top = logic.entity_name[1]
+    tb_path = os.path.join(work_dir, top + ".vhd")
+    wave_file = f"bench_wave.{dump}" if dump != "none" else None
+
+    result = {'render': _timed(logic._write_testbench, tb_path, stimulus, timing)}
+    _apply_clock_style(tb_path, clock)
+    result['testbench_bytes'] = os.path.getsize(tb_path)
+    result['analyze'] = (_timed(backend.analyze, "bench_dut.vhd", cwd=work_dir)
+                         + _timed(backend.analyze, os.path.basename(tb_path), cwd=work_dir))
+    result['elaborate'] = _timed(backend.elaborate, top, cwd=work_dir)
+    result['run'] = _timed(backend.run, top, wave_file, cwd=work_dir)
+    result['dump_bytes'] = os.path.getsize(os.path.join(work_dir, wave_file)) if wave_file else 0
+    result['total'] = result['analyze'] + result['elaborate'] + result['run']
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VVTG testbench style simulation benchmark")
+    parser.add_argument("--simulator", default="auto", help="auto, ghdl, nvc or stub")
+    parser.add_argument("--segments", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--ports", type=int, default=8, help="input ports of the synthetic DUT")
+    parser.add_argument("--styles", nargs="+", default=list(STIMULUS_STYLES), choices=STIMULUS_STYLES)
+    parser.add_argument("--clocks", nargs="+", default=list(CLOCK_STYLES), choices=list(CLOCK_STYLES),
+                        help="clock process variants to try")
+    parser.add_argument("--dumps", nargs="+", default=None,
+                        help="dump formats to try (default: all of the simulator's plus none)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", default=None, help="write results JSON here")
+    args = parser.parse_args()
+
+    if args.simulator == "stub":
+        backend = StubBackend()
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            backend = select_backend(os.path.dirname(BENCH_DIR), args.simulator)
+        if not backend:
+            print(f"Simulator '{args.simulator}' not found, use --simulator stub to test the harness.")
+            sys.exit(1)
+    print(f"Simulator: {backend.describe()}")
+
+    dumps = args.dumps or list(backend.dump_formats) + ["none"]
+    dut_source = corpus.make_entity("bench_dut", args.ports, 2, seed=1)
+    work_root = tempfile.mkdtemp(prefix="vvtg-simbench-")
+
+    results = []
+    print(f"\n{'segments':>9} {'style':<9}{'clock':<8}{'dump':<6}{'analyze':>10}{'elab':>10}{'run':>10}"
+          f"{'total':>10}{'tb KiB':>10}{'dump KiB':>10}")
+    try:
+        for segments in args.segments:
+            for style in args.styles:
+                for clock in args.clocks:
+                    for dump in dumps:
+                        runs = []
+                        for _ in range(args.repeat):
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                runs.append(run_style(backend, dut_source, segments, style, dump, work_root,
+                                                      clock))
+                        row = {'segments': segments, 'style': style, 'clock': clock, 'dump': dump}
+                        for key in ('render', 'analyze', 'elaborate', 'run', 'total'):
+                            row[key] = statistics.median(r[key] for r in runs)
+                        row['testbench_bytes'] = runs[0]['testbench_bytes']
+                        row['dump_bytes'] = runs[0]['dump_bytes']
+                        results.append(row)
+                        print(f"{segments:>9} {style:<9}{clock:<8}{dump:<6}{row['analyze'] * 1000:>8.1f}ms"
+                              f"{row['elaborate'] * 1000:>8.1f}ms{row['run'] * 1000:>8.1f}ms"
+                              f"{row['total'] * 1000:>8.1f}ms{row['testbench_bytes'] / 1024:>10.1f}"
+                              f"{row['dump_bytes'] / 1024:>10.1f}")
+    finally:
+        shutil.rmtree(work_root, ignore_errors=True)
+
+    # Fastest style and clock per segment count, summed over dump settings
+    print(f"\nCurrent default: {DEFAULT_STIMULUS_STYLE}")
+    for segments in args.segments:
+        totals = {}
+        for row in results:
+            if row['segments'] == segments:
+                key = (row['style'], row['clock'])
+                totals[key] = totals.get(key, 0) + row['total']
+        style, clock = min(totals, key=totals.get)
+        print(f"  {segments:>8} segments: fastest style '{style}' with the '{clock}' clock")
+
+    if args.output:
+        report = {
+            'meta': {
+                'simulator': backend.describe(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'date': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
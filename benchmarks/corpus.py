@@ -0,0 +1,147 @@
+"""
+Synthetic VHDL and stimulus corpus for the benchmarks.
+
+Everything is generated deterministically from a seed so runs are
+comparable across machines and commits.
+"""
+import os
+import re
+import random
+
+
+def make_entity(name, num_inputs, num_outputs=1, vector_ratio=0.5, seed=0):
+    """
+    Build a flat entity with the given number of ports.
+
+    Args:
+        name: Entity name
+        num_inputs: Input ports besides clk
+        num_outputs: Output ports
+        vector_ratio: Fraction of ports that are STD_LOGIC_VECTOR
+
+    Returns:
+        str: VHDL source
+    """
+    rng = random.Random(seed)
+    ports = ["        clk : in STD_LOGIC"]
+    for i in range(num_inputs):
+        ports.append(f"        in_{i} : in {_port_type(rng, vector_ratio)}")
+    for i in range(num_outputs):
+        ports.append(f"        out_{i} : out {_port_type(rng, vector_ratio)}")
+    port_block = ";\n".join(ports)
+
+    return f"""library IEEE;
+use IEEE.STD_LOGIC_1164.ALL;
+
+entity {name} is
+    Port (
+{port_block}
+    );
+end {name};
+
+architecture Behavioral of {name} is
+begin
+end Behavioral;
+"""
+
+
+def _port_type(rng, vector_ratio):
+    if rng.random() < vector_ratio:
+        return f"STD_LOGIC_VECTOR({rng.choice([3, 7, 15, 31])} downto 0)"
+    return "STD_LOGIC"
+
+
+def make_netlist(name, num_instances, num_components=8, ports_per_component=4):
+    """
+    Build a structural netlist: many instances of a few components.
+
+    With a few thousand instances this produces multi-MB sources, which
+    stresses the regex based port and component extraction.
+
+    Returns:
+        str: VHDL source
+    """
+    lines = [
+        "library IEEE;",
+        "use IEEE.STD_LOGIC_1164.ALL;",
+        "",
+        f"entity {name} is",
+        "    Port (",
+        "        clk : in STD_LOGIC;",
+        "        din : in STD_LOGIC_VECTOR(7 downto 0);",
+        "        dout : out STD_LOGIC_VECTOR(7 downto 0)",
+        "    );",
+        f"end {name};",
+        "",
+        f"architecture Structural of {name} is",
+    ]
+    for c in range(num_components):
+        lines.append(f"    component cell_{c}")
+        lines.append("        Port (")
+        port_lines = [f"            p{p} : in STD_LOGIC" for p in range(ports_per_component)]
+        port_lines.append("            q : out STD_LOGIC")
+        lines.append(";\n".join(port_lines))
+        lines.append("        );")
+        lines.append("    end component;")
+    for i in range(num_instances):
+        lines.append(f"    signal n_{i} : STD_LOGIC;")
+    lines.append("begin")
+    for i in range(num_instances):
+        c = i % num_components
+        inputs = ", ".join(f"p{p} => n_{(i + p + 1) % num_instances}" for p in range(ports_per_component))
+        lines.append(f"    u_{i}: cell_{c} port map ({inputs}, q => n_{i});")
+    lines.append("end Structural;")
+    return "\n".join(lines) + "\n"
+
+
+def write_hierarchy(directory, depth, ports=4):
+    """
+    Write a chain of files where each level declares the next as a
+    component, resolved as <name>.vhd next to it.
+
+    Returns:
+        str: Path of the top-level file
+    """
+    os.makedirs(directory, exist_ok=True)
+    for level in range(depth, -1, -1):
+        name = f"level_{level}"
+        source = make_entity(name, ports, 1, seed=level)
+        if level < depth:
+            decl = f"    component level_{level + 1}\n        Port (clk : in STD_LOGIC);\n    end component;\n"
+            source = source.replace("begin\nend Behavioral;", decl + "begin\nend Behavioral;")
+        with open(os.path.join(directory, name + ".vhd"), 'w') as file:
+            file.write(source)
+    return os.path.join(directory, "level_0.vhd")
+
+
+def make_stimulus(port_names, port_types, num_segments, density=0.5, seed=0):
+    """
+    Build a random stimulus over num_segments segments.
+
+    Args:
+        density: Fraction of segments highlighted per port
+
+    Returns:
+        Stimulus: Stimulus usable in place of a WaveGenCanvas
+    """
+    from core.stimulus import Stimulus
+
+    rng = random.Random(seed)
+    segments = []
+    values = []
+    for dtype in port_types:
+        highlighted = [i for i in range(num_segments) if rng.random() < density]
+        segments.append(highlighted)
+        if dtype.upper().startswith("STD_LOGIC_VECTOR"):
+            width = _vector_width(dtype)
+            values.append({i: format(rng.getrandbits(width), f"0{width}b") for i in highlighted})
+        else:
+            values.append({})
+    return Stimulus(port_names, port_types, segments, values)
+
+
+def _vector_width(dtype):
+    match = re.search(r'\((\d+)\s+downto\s+(\d+)\)', dtype, re.IGNORECASE)
+    if not match:
+        return 8
+    return int(match.group(1)) - int(match.group(2)) + 1
@@ -0,0 +1,106 @@
+"""
+Minimal stand-in for tkinter so WaveGenCanvas can be benchmarked on
+machines without a display. Widgets accept and ignore layout calls;
+Canvas keeps its items in a dict so drawing cost stays proportional to
+what real Tk would be asked to draw.
+"""
+import sys
+import types
+
+
+class _Widget:
+    def __init__(self, parent=None, *args, **kwargs):
+        self.parent = parent
+        self.options = dict(kwargs)
+
+    def pack(self, *args, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    configure = config
+
+    def destroy(self):
+        pass
+
+    def after(self, delay, func=None, *args):
+        if func:
+            func(*args)
+
+    def after_idle(self, func, *args):
+        func(*args)
+
+    def set(self, *args):
+        pass
+
+
+class Canvas(_Widget):
+    def __init__(self, parent=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.items = {}
+        self._next_id = 1
+
+    def _create(self, kind, coords, kwargs):
+        item_id = self._next_id
+        self._next_id += 1
+        self.items[item_id] = (kind, coords, kwargs)
+        return item_id
+
+    def create_rectangle(self, *coords, **kwargs):
+        return self._create("rectangle", coords, kwargs)
+
+    def create_text(self, *coords, **kwargs):
+        return self._create("text", coords, kwargs)
+
+    def create_window(self, *coords, **kwargs):
+        return self._create("window", coords, kwargs)
+
+    def delete(self, *tags):
+        if "all" in tags:
+            self.items.clear()
+
+    def canvasx(self, x):
+        return x
+
+    def xview(self, *args):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def bbox(self, *args):
+        return (0, 0, 0, 0)
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+
+class Variable:
+    def __init__(self, master=None, value=None):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+def install():
+    """
+    Register the stub as the tkinter module.
+
+    Must run before any module importing tkinter is loaded.
+    """
+    module = types.ModuleType("tkinter")
+    for name in ("Tk", "Frame", "Label", "Button", "Entry", "Scrollbar", "Toplevel",
+                 "Checkbutton", "OptionMenu"):
+        setattr(module, name, type(name, (_Widget,), {}))
+    module.Canvas = Canvas
+    module.IntVar = module.StringVar = module.BooleanVar = Variable
+    sys.modules["tkinter"] = module
+    return module
@@ -0,0 +1,48 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Onedir build without UPX: nothing is unpacked or decompressed at start,
+# so time to first window is much lower than with main.spec (onefile).
+# Build with: pyinstaller main_onedir.spec  ->  dist/main/main.exe
+
+
+a = Analysis(
+    ['src\\main.py'],
+    pathex=['src'],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='main',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='main',
+)
@@ -0,0 +1,49 @@
+"""
+Measure time to first window of a VVTG build.
+
+Runs the given command with --measure-startup several times and reports
+the wall time seen from outside (includes onefile unpacking) next to the
+time reported by the app itself.
+
+Usage:
+    python scripts/measure_startup.py dist/main.exe
+    python scripts/measure_startup.py dist/main/main.exe
+    python scripts/measure_startup.py python src/main.py
+"""
+import re
+import sys
+import time
+import statistics
+import subprocess
+
+
+def measure(cmd, runs=5):
+    """
+    Returns:
+        tuple: (list of external wall times, list of reported times), in ms
+    """
+    wall = []
+    reported = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(cmd + ["--measure-startup"], capture_output=True, text=True)
+        wall.append((time.perf_counter() - start) * 1000)
+        match = re.search(r'Time to first window: (\d+) ms', result.stdout)
+        if match:
+            reported.append(int(match.group(1)))
+        else:
+            print(result.stdout + result.stderr)
+    return wall, reported
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    wall, reported = measure(sys.argv[1:])
+    print(f"Wall time (process start to exit): median {statistics.median(wall):.0f} ms, "
+          f"min {min(wall):.0f} ms over {len(wall)} runs")
+    if reported:
+        print(f"Reported time to first window:     median {statistics.median(reported):.0f} ms, "
+              f"min {min(reported):.0f} ms")
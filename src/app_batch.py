@@ -0,0 +1,274 @@
+"""
+Batch runner for VHDL Testbench Generator.
+
+Simulates many small DUTs (e.g. a course's lab exercises) in one
+simulator run. Every DUT gets its usual testbench, <entity>_tb.vhd next
+to it, and a generated top level instantiates all of these testbenches.
+The batch is analyzed and elaborated once and simulated in a single run;
+the combined VCD dump is then split into one <entity>_wave.vcd per DUT,
+so golden checks and coverage work per DUT as after a single run.
+
+DUTs whose entity or component names clash with a different source are
+put into separate batches, each with its own work library.
+
+A DUT's stimulus is read from <name>.stim.json next to it, if present.
+"""
+import io
+import os
+import re
+import contextlib
+
+from app_logic import TestbenchLogic
+from app_headless import DEFAULT_TIMING
+from core.libcache import prepare_libraries
+from core.stimulus import Stimulus
+from core.vcd import split_dump
+from utils.trace import span
+
+
+BATCH_TOP = "vvtg_batch"
+STIMULUS_SUFFIX = ".stim.json"
+
+
+class BatchRunner:
+    """Generates and simulates a set of DUTs in as few simulator runs as possible."""
+
+    def __init__(self, file_paths, timing_config=None, work_dir=None, libraries=None):
+        """
+        Args:
+            file_paths: DUT files
+            timing_config: Timing shared by all testbenches
+            work_dir: Directory for the batch work libraries and the
+                combined dump, defaults to vvtg_batch/ next to the DUTs
+            libraries: Dict of shared library name -> source directory,
+                analyzed through the shared library cache
+        """
+        self.file_paths = [os.path.abspath(p) for p in file_paths]
+        self.timing_config = dict(DEFAULT_TIMING, **(timing_config or {}))
+        self.common_dir = os.path.commonpath([os.path.dirname(p) for p in self.file_paths])
+        self.work_dir = work_dir or os.path.join(self.common_dir, BATCH_TOP)
+        self.libraries = libraries or {}
+
+        # Applied to every DUT, see TestbenchLogic
+        self.simulator_override = None
+        self.stimulus_style = None
+        self.check_golden = False
+        self.collect_coverage = False
+
+        # DUT path -> {'status', 'testbench', 'wave_file', 'golden', 'coverage', 'messages'}
+        self.results = {}
+
+    def run(self):
+        """
+        Load, generate and simulate every DUT.
+
+        Returns:
+            bool: True if every DUT simulated (and matched its golden dump)
+        """
+        with span("batch", duts=len(self.file_paths)):
+            logics = self._load()
+            if not logics:
+                return False
+            simulator = logics[0].simulator
+            if not simulator:
+                print("ERROR: No simulator found (GHDL or NVC).")
+                return False
+            for logic in logics:
+                logic.set_simulator(simulator)
+
+            batches = self._group(logics)
+            for index, batch in enumerate(batches):
+                print(f"\n=== Batch {index + 1}/{len(batches)}: {len(batch)} DUT(s) ===")
+                self._run_batch(simulator, batch, os.path.join(self.work_dir, f"batch_{index}"))
+
+        self._print_summary()
+        return all(r['status'] == 'done' and r.get('golden') is not False for r in self.results.values())
+
+    def _load(self):
+        parse_cache = {}
+        logics = []
+        for path in self.file_paths:
+            logic = TestbenchLogic()
+            logic.parse_cache = parse_cache
+            logic.simulator_override = self.simulator_override
+            logic.stimulus_style = self.stimulus_style
+            logic.check_golden = self.check_golden
+            logic.collect_coverage = self.collect_coverage
+            self.results[path] = {'status': 'failed', 'messages': []}
+            if logic.load_vhdl_file(path) is None or not logic.entity_name:
+                continue
+            logics.append(logic)
+        return logics
+
+    def _units(self, logic):
+        """
+        Returns:
+            dict: Lowercase design unit name -> (source path, content digest)
+        """
+        units = {logic.entity_name[0].lower(): logic.component_file_path}
+        for path in logic.resolve_component_files():
+            units[os.path.splitext(os.path.basename(path))[0].lower()] = path
+        return {name: (path, logic._file_digest(path)) for name, path in units.items()}
+
+    def _group(self, logics):
+        """
+        Split DUTs into batches without conflicting design units.
+
+        A component name may appear several times in a batch only if
+        every occurrence has the same content.
+
+        Returns:
+            list: Lists of TestbenchLogic
+        """
+        batches = []
+        for logic in logics:
+            units = self._units(logic)
+            top = logic.entity_name[0].lower()
+            for batch_units, batch in batches:
+                # Each DUT's own entity is instantiated once per batch, even
+                # if another DUT is an identical copy
+                if any(top == other.entity_name[0].lower() for other in batch):
+                    continue
+                if all(batch_units.get(name, unit)[1] == unit[1] for name, unit in units.items()):
+                    batch_units.update(units)
+                    batch.append(logic)
+                    break
+            else:
+                batches.append((dict(units), [logic]))
+        return [batch for _, batch in batches]
+
+    def _load_stimulus(self, logic):
+        names = logic.get_input_port_names()
+        types = logic.get_input_port_types()
+        stimulus_path = os.path.splitext(logic.component_file_path)[0] + STIMULUS_SUFFIX
+        if os.path.exists(stimulus_path):
+            return Stimulus.from_json(stimulus_path, names, types)
+        return Stimulus(names, types)
+
+    def _library_paths(self, simulator, batch):
+        paths = prepare_libraries(simulator, self.libraries) if self.libraries else []
+        for logic in batch:
+            for path in logic._project_libraries(os.path.dirname(logic.component_file_path)):
+                if path not in paths:
+                    paths.append(path)
+        return paths
+
+    def _run_batch(self, simulator, batch, work_dir):
+        os.makedirs(work_dir, exist_ok=True)
+        try:
+            lib_paths = self._library_paths(simulator, batch)
+        except Exception as e:
+            print(f"ERROR: {e}")
+            return
+
+        # Testbenches are written next to each DUT, as in a single run
+        for logic in batch:
+            tb_path = os.path.join(os.path.dirname(logic.component_file_path), logic.entity_name[1] + ".vhd")
+            with span("render", entity=logic.entity_name[0]):
+                logic._write_testbench(tb_path, self._load_stimulus(logic), self.timing_config)
+            logic.last_testbench = tb_path
+            self.results[logic.component_file_path]['testbench'] = tb_path
+
+        # Analyze DUT by DUT, so one broken DUT does not take the batch down
+        analyzed = set()
+        included = []
+        for logic in batch:
+            sources = logic.resolve_component_files() + [logic.component_file_path, logic.last_testbench]
+            try:
+                for source in sources:
+                    # Identical components shared by several DUTs are analyzed once
+                    digest = (os.path.basename(source).lower(), logic._file_digest(source))
+                    if digest in analyzed:
+                        continue
+                    with span("analyze", file=os.path.basename(source)):
+                        simulator.analyze(source, library_paths=lib_paths, cwd=work_dir)
+                    analyzed.add(digest)
+                included.append(logic)
+            except Exception as e:
+                print(f"ERROR: {os.path.basename(logic.component_file_path)}: {e}")
+        if not included:
+            return
+
+        top_path = os.path.join(work_dir, BATCH_TOP + ".vhd")
+        self._write_top(top_path, included)
+        wave_file = os.path.join(work_dir, simulator.wave_file_name(BATCH_TOP, "vcd"))
+        log = io.StringIO()
+        try:
+            with span("analyze", file=os.path.basename(top_path)):
+                simulator.analyze(top_path, library_paths=lib_paths, cwd=work_dir)
+            with span("elaborate", top=BATCH_TOP):
+                simulator.elaborate(BATCH_TOP, library_paths=lib_paths, cwd=work_dir)
+            with span("simulate", top=BATCH_TOP) as s:
+                with contextlib.redirect_stdout(log):
+                    simulator.run(BATCH_TOP, os.path.basename(wave_file), library_paths=lib_paths, cwd=work_dir)
+                s.set(dump_bytes=os.path.getsize(wave_file) if os.path.exists(wave_file) else 0)
+        except Exception as e:
+            print(log.getvalue(), end="")
+            print(f"ERROR: Batch failed: {e}")
+            return
+        print(log.getvalue(), end="")
+
+        # Split the combined dump and report back per DUT
+        instances = {}
+        for logic in included:
+            dut_wave = os.path.join(os.path.dirname(logic.component_file_path),
+                                    simulator.wave_file_name(logic.entity_name[0], "vcd"))
+            instances[self._instance_label(logic)] = (dut_wave, logic.entity_name[1])
+        with span("split", duts=len(instances)):
+            split_dump(wave_file, instances)
+
+        for logic in included:
+            result = self.results[logic.component_file_path]
+            result['messages'] = self._messages_for(logic, log.getvalue())
+            result['status'] = 'done'
+            logic.last_wave_file = instances[self._instance_label(logic)][0]
+            result['wave_file'] = logic.last_wave_file
+            if self.check_golden or self.collect_coverage:
+                print(f"\n--- {logic.entity_name[0]} ---")
+            if self.check_golden:
+                golden = logic.compare_golden()
+                if golden is not None:
+                    result['golden'] = not (golden['divergences'] or golden['missing'] or golden['extra'])
+            if self.collect_coverage:
+                coverage = logic.compute_coverage()
+                if coverage:
+                    result['coverage'] = sum(c.toggle_coverage for c in coverage.values()) / len(coverage)
+
+    def _instance_label(self, logic):
+        return "tb_" + logic.entity_name[0].lower()
+
+    def _write_top(self, top_path, batch):
+        """Write the top level instantiating every DUT's testbench."""
+        lines = [
+            "-- Generated by VVTG batch mode, do not edit",
+            f"entity {BATCH_TOP} is",
+            f"end {BATCH_TOP};",
+            "",
+            f"architecture Behavioral of {BATCH_TOP} is",
+            "begin",
+        ]
+        for logic in batch:
+            lines.append(f"    {self._instance_label(logic)}: entity work.{logic.entity_name[1]};")
+        lines += ["end Behavioral;", ""]
+        with open(top_path, 'w') as file:
+            file.write("\n".join(lines))
+
+    def _messages_for(self, logic, output):
+        """
+        Simulator report lines that belong to one DUT.
+
+        Reports name the testbench file (often with its full path) or the
+        instance path. Names must not be preceded or followed by another
+        name character, so add_tb.vhd does not claim /labs/fadd_tb.vhd.
+        """
+        names = (re.escape(logic.entity_name[1] + ".vhd"), re.escape(self._instance_label(logic)))
+        pattern = re.compile(r"(?<!\w)(" + "|".join(names) + r")(?!\w)", re.IGNORECASE)
+        return [line for line in output.splitlines() if pattern.search(line)]
+
+    def _print_summary(self):
+        print(f"\n{'DUT':<30}{'status':<9}{'golden':<9}{'toggle':>8}  messages")
+        for path, result in self.results.items():
+            golden = {True: "match", False: "DIFFERS"}.get(result.get('golden'), "-")
+            toggle = f"{result['coverage'] * 100:.0f}%" if result.get('coverage') is not None else "-"
+            print(f"{os.path.relpath(path, self.common_dir):<30}{result['status']:<9}{golden:<9}{toggle:>8}  "
+                  f"{len(result['messages'])}")
@@ -0,0 +1,336 @@
+"""
+Generation daemon for VHDL Testbench Generator.
+
+Keeps tool discovery, parsed entities and analyzed shared libraries warm
+across jobs, and accepts generate/simulate jobs as JSON over HTTP on
+localhost or on a Unix socket. Jobs run on a bounded worker pool, each
+in its own directory with its own TestbenchLogic state.
+
+Submit a job:
+    POST /jobs     {"action": "simulate",
+                    "files": {"my_register.vhd": "<vhdl source>"},
+                    "top": "my_register.vhd",
+                    "stimulus": {"segments": {"write": [0, 1]}},
+                    "timing": {"test_length": 400},
+                    "wait": true}
+    GET  /jobs/<id>       job status and result
+    DELETE /jobs/<id>     forget a job and remove its directory
+    GET  /status          daemon status
+"""
+import io
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import threading
+import contextlib
+import socketserver
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app_logic import TestbenchLogic
+from app_headless import DEFAULT_TIMING
+from core.libcache import prepare_libraries, LibraryError
+from core.ports import extract_component_names
+from core.simulator import select_backend
+from core.stimulus import Stimulus
+from utils.config import get_config_dir
+
+
+class JobError(Exception):
+    """Raised for invalid job requests."""
+
+
+class _ThreadOutput:
+    """sys.stdout replacement that routes print() of a job thread to its log."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    @contextlib.contextmanager
+    def capture(self, buffer):
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+
+class GenerationDaemon:
+    """Runs generate/simulate jobs with warm caches."""
+
+    def __init__(self, state_dir=None, workers=2, libraries=None, simulator="auto", keep_jobs=1000):
+        """
+        Args:
+            state_dir: Directory for job folders
+            workers: Maximum number of jobs running at the same time
+            libraries: Dict of library name -> directory of shared VHDL
+                sources, analyzed once into the shared library cache and
+                made visible to every job
+            simulator: 'auto', 'ghdl' or 'nvc'
+            keep_jobs: Number of finished jobs kept before the oldest
+                are removed along with their directories
+        """
+        self.state_dir = state_dir or os.path.join(get_config_dir(), "daemon")
+        self.jobs_dir = os.path.join(self.state_dir, "jobs")
+        os.makedirs(self.jobs_dir, exist_ok=True)
+
+        self.workers = workers
+        self.keep_jobs = keep_jobs
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vvtg-job")
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Warm state shared by all jobs
+        self.output = _ThreadOutput(sys.stdout)
+        sys.stdout = self.output
+        self.base_logic = TestbenchLogic()
+        self.parse_cache = {}
+        self.simulator = select_backend(self.base_logic.base_dir, simulator)
+        self.library_paths = []
+        self._prepare_libraries(libraries or {})
+
+    def _prepare_libraries(self, libraries):
+        """
+        Analyze shared libraries once, through the user-level cache
+        (core.libcache) that the GUI and headless runs share.
+        """
+        if not libraries or not self.simulator:
+            return
+        try:
+            self.library_paths = prepare_libraries(self.simulator, libraries)
+        except LibraryError as e:
+            print(f"ERROR: {e}")
+
+    def submit(self, request):
+        """
+        Queue a job.
+
+        Args:
+            request: Decoded job request (see module docstring)
+
+        Returns:
+            dict: Job record
+        """
+        action = request.get('action', 'simulate')
+        if action not in ('generate', 'simulate'):
+            raise JobError(f"Unknown action '{action}'")
+        if not request.get('files') and not request.get('dut'):
+            raise JobError("Job needs 'files' or 'dut'")
+
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            'id': job_id,
+            'action': action,
+            'status': 'queued',
+            'submitted': time.time(),
+            'dir': os.path.join(self.jobs_dir, job_id),
+        }
+        with self._lock:
+            self.jobs[job_id] = job
+            self._trim_jobs()
+            job['future'] = self.executor.submit(self._run_job, job, request)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def job_to_json(self, job):
+        """Copy of a job record without internals, safe while the job runs."""
+        with self._lock:
+            return {k: v for k, v in job.items() if k not in ('future', 'dir')}
+
+    def delete(self, job_id):
+        with self._lock:
+            job = self.jobs.pop(job_id, None)
+        if job:
+            shutil.rmtree(job['dir'], ignore_errors=True)
+        return job
+
+    def status(self):
+        with self._lock:
+            states = [j['status'] for j in self.jobs.values()]
+        return {
+            'simulator': self.simulator.describe() if self.simulator else None,
+            'workers': self.workers,
+            'queued': states.count('queued'),
+            'running': states.count('running'),
+            'jobs': len(states),
+            'parse_cache': len(self.parse_cache),
+            'library_paths': self.library_paths,
+        }
+
+    def _trim_jobs(self):
+        # Called with the lock held; only finished jobs are dropped
+        finished = [k for k, j in self.jobs.items() if j['status'] in ('done', 'failed')]
+        for job_id in finished[:max(0, len(self.jobs) - self.keep_jobs)]:
+            job = self.jobs.pop(job_id)
+            shutil.rmtree(job['dir'], ignore_errors=True)
+
+    def _stage_sources(self, job, request):
+        """
+        Copy or write the job sources into the job directory.
+
+        Returns:
+            str: Path of the DUT file inside the job directory
+        """
+        os.makedirs(job['dir'], exist_ok=True)
+
+        if request.get('files'):
+            for name, content in request['files'].items():
+                if os.path.basename(name) != name:
+                    raise JobError(f"Invalid file name '{name}'")
+                with open(os.path.join(job['dir'], name), 'w') as file:
+                    file.write(content)
+            top = request.get('top') or next(iter(request['files']))
+            if top not in request['files']:
+                raise JobError(f"'top' must be one of the file names in 'files', got '{top}'")
+            dut = os.path.realpath(os.path.join(job['dir'], top))
+            if os.path.dirname(dut) != os.path.realpath(job['dir']):
+                raise JobError(f"Invalid top file '{top}'")
+            return dut
+
+        dut = os.path.abspath(request['dut'])
+        if not os.path.exists(dut):
+            raise JobError(f"File not found: {dut}")
+        source_dir = os.path.dirname(dut)
+        shutil.copy(dut, job['dir'])
+        for name in extract_component_names(dut):
+            component = os.path.join(source_dir, name + ".vhd")
+            if os.path.exists(component):
+                shutil.copy(component, job['dir'])
+        return os.path.join(job['dir'], os.path.basename(dut))
+
+    def _run_job(self, job, request):
+        # Results are published at once when the job ends, see job_to_json
+        log = io.StringIO()
+        result = {}
+        with self._lock:
+            job['status'] = 'running'
+        start = time.perf_counter()
+        with self.output.capture(log):
+            try:
+                dut = self._stage_sources(job, request)
+
+                logic = TestbenchLogic()
+                logic.parse_cache = self.parse_cache
+                logic.library_paths = self.library_paths
+                logic.set_simulator(self.simulator)
+
+                if logic.load_vhdl_file(dut) is None:
+                    raise JobError("Could not parse DUT")
+
+                stimulus = Stimulus.from_dict(request.get('stimulus', {}),
+                                              logic.get_input_port_names(), logic.get_input_port_types())
+                timing = dict(DEFAULT_TIMING, **request.get('timing', {}))
+
+                ok = logic.generate_testbench(stimulus, timing, launch_viewer=False,
+                                              simulate=job['action'] == 'simulate')
+                result['status'] = 'done' if ok else 'failed'
+                result['testbench'] = logic.last_testbench
+                result['wave_file'] = logic.last_wave_file if job['action'] == 'simulate' else None
+            except Exception as e:
+                print(f"ERROR: {e}")
+                result['status'] = 'failed'
+        result['duration'] = time.perf_counter() - start
+        result['log'] = log.getvalue()
+        with self._lock:
+            status = result.pop('status')
+            job.update(result)
+            job['status'] = status
+        return job
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """JSON API, served over TCP or a Unix socket."""
+
+    daemon = None
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send(self, code, data):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self):
+        parts = self.path.strip("/").split("/")
+        return parts[1] if len(parts) == 2 and parts[0] == "jobs" else None
+
+    def do_GET(self):
+        if self.path == "/status":
+            return self._send(200, self.daemon.status())
+        job = self.daemon.get(self._job_id())
+        if not job:
+            return self._send(404, {'error': 'not found'})
+        self._send(200, self.daemon.job_to_json(job))
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self._send(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job = self.daemon.submit(request)
+        except (ValueError, JobError) as e:
+            return self._send(400, {'error': str(e)})
+        if request.get('wait'):
+            job['future'].result()
+        data = self.daemon.job_to_json(job)
+        self._send(202 if data['status'] == 'queued' else 200, data)
+
+    def do_DELETE(self):
+        job = self.daemon.delete(self._job_id())
+        self._send(200 if job else 404, {'deleted': bool(job)})
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(daemon, host="127.0.0.1", port=8765, socket_path=None):
+    """
+    Serve the job API until interrupted.
+
+    Args:
+        daemon: GenerationDaemon
+        host, port: TCP address, used when socket_path is None
+        socket_path: Path of a Unix socket to listen on instead
+    """
+    handler = type("Handler", (DaemonRequestHandler,), {'daemon': daemon})
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, handler)
+        print(f"Daemon listening on {socket_path}")
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        print(f"Daemon listening on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Daemon stopped.")
+    finally:
+        server.server_close()
+        daemon.executor.shutdown(wait=False, cancel_futures=True)
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -2,18 +2,20 @@
 GUI for VHDL Testbench Generator.
 Handles window creation, widgets, layout, and user interactions.
 """
+import queue
 import tkinter as tk
-from tkinter import filedialog
 
 from gui.entries import DurationEntry
 from gui.wave_gen import WaveGenCanvas
+from gui.status_panel import StatusPanel
 from app_logic import TestbenchLogic
 
 
 class VHDLTestbenchGUI:
     
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, watch=False, measure_startup=False):
         self.file_path = file_path
+        self.measure_startup = measure_startup
         self.logic = TestbenchLogic()
         
         # Create window
@@ -41,9 +43,24 @@ class VHDLTestbenchGUI:
         self.wave_canvas = None
         self.dynamic_widgets = []
         
+        # Watch mode
+        self.watch_enabled = tk.BooleanVar()
+        self.watch_enabled.set(watch)
+        self.watcher = None
+        self.watch_changes = queue.Queue()
+        
+        # Golden waveform comparison
+        self.check_golden = tk.BooleanVar()
+        
+        # Toggle coverage of each run, shown on the port labels
+        self.collect_coverage = tk.BooleanVar()
+        
         # Create widgets
         self._create_widgets()
         
+        if watch:
+            self._on_watch_toggled()
+        
         # Load default file
 
     
@@ -90,15 +107,39 @@ class VHDLTestbenchGUI:
         # Submit button
         submit_button = tk.Button(entry_frame, text="Submit", command=self._on_submit_clicked)
         submit_button.pack(pady=5)
+        
+        # Watch toggle
+        watch_check = tk.Checkbutton(entry_frame, text="Watch files", variable=self.watch_enabled,
+                                     command=self._on_watch_toggled)
+        watch_check.pack(pady=5)
+        
+        # Golden waveform regression
+        golden_frame = tk.Frame(entry_frame)
+        golden_check = tk.Checkbutton(golden_frame, text="Compare with golden", variable=self.check_golden,
+                                      command=self._on_golden_toggled)
+        golden_check.pack(side="left")
+        save_golden_button = tk.Button(golden_frame, text="Save as Golden", command=self.logic.save_golden)
+        save_golden_button.pack(side="left", padx=5)
+        coverage_check = tk.Checkbutton(golden_frame, text="Coverage", variable=self.collect_coverage,
+                                        command=self._on_coverage_toggled)
+        coverage_check.pack(side="left")
+        golden_frame.pack(pady=5)
+        
+        # Timings of the last run
+        self.status_panel = StatusPanel(entry_frame)
+        self.status_panel.pack(pady=5, anchor="w")
     
     def _load_default_file(self):
         """Load default VHDL file at startup."""
         default_file = self.component_file_name.get()
         if default_file:
-            self.logic.load_vhdl_file(default_file)
+            return self.logic.load_vhdl_file(default_file)
+        return None
     
     def _on_browse_clicked(self):
         """Handle Browse button click."""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             initialdir=".",
             title="Select VHDL Component File",
@@ -110,29 +151,123 @@ class VHDLTestbenchGUI:
             result = self.logic.load_vhdl_file(filename)
             
             if result:
+                self._update_watch_paths()
                 self._refresh_waveform_editor()
     
     def _on_submit_clicked(self):
         """Handle Submit button click - creates/refreshes waveform editor."""
-        self._load_default_file()
+        if self._load_default_file():
+            self._update_watch_paths()
         self._refresh_waveform_editor()
     
+    def _update_watch_paths(self):
+        """Point a running watcher at the files of the newly loaded DUT."""
+        if self.watcher:
+            self.watcher.set_paths(self.logic.get_watch_paths())
+    
     def _on_generate_clicked(self):
         """Handle Generate button click - generates testbench and runs simulation."""
         if not self.wave_canvas:
             print("ERROR: Waveform canvas not initialized.")
             return
         
-        # Collect timing configuration
-        timing_config = {
+        # Generate testbench, optionally under a profiler
+        timing_config = self._get_timing_config()
+        mode = self.status_panel.profile_mode.get()
+        if mode == "off":
+            self.logic.generate_testbench(self.wave_canvas, timing_config)
+        else:
+            import os
+            from utils.trace import profile_call
+            output = None
+            if mode == "cprofile" and self.logic.component_file_path:
+                output = os.path.join(os.path.dirname(self.logic.component_file_path), "generate.prof")
+            profile_call(lambda: self.logic.generate_testbench(self.wave_canvas, timing_config), mode, output)
+        self._show_coverage()
+    
+    def _on_golden_toggled(self):
+        """Golden comparison needs VCD dumps, the next run switches format."""
+        self.logic.check_golden = self.check_golden.get()
+    
+    def _on_coverage_toggled(self):
+        """Coverage needs VCD dumps as well, the next run switches format."""
+        self.logic.collect_coverage = self.collect_coverage.get()
+        if not self.logic.collect_coverage:
+            self.logic.last_coverage = None
+            self._show_coverage()
+    
+    def _show_coverage(self):
+        """Mark untoggled input bits of the last run on the waveform editor."""
+        if not self.wave_canvas:
+            return
+        coverage = self.logic.last_coverage or {}
+        untoggled = [coverage[name].untoggled_bits() if name in coverage else None
+                     for name in self.logic.get_input_port_names()]
+        self.wave_canvas.set_coverage(untoggled)
+    
+    def _get_timing_config(self):
+        """Collect timing configuration from the entries."""
+        return {
             'high_time': self.high_time.get(),
             'low_time': self.low_time.get(),
             'test_length': self.test_length.get(),
             'segment_duration': self.segment_duration.get()
         }
+    
+    def _on_watch_toggled(self):
+        """Start or stop watching the DUT and its component files."""
+        from core.watch import FileWatcher
+        
+        if self.watch_enabled.get():
+            if not self.logic.component_file_path:
+                self._load_default_file()
+            if not self.wave_canvas:
+                self._refresh_waveform_editor()
+            # Callback runs on the watcher thread, hand over through the queue
+            self.watcher = FileWatcher(self.logic.get_watch_paths(), self.watch_changes.put)
+            self.watcher.start()
+            print(f"Watch mode on ({self.watcher.backend}).")
+            self.root.after(200, self._poll_watch)
+        elif self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            print("Watch mode off.")
+    
+    def _poll_watch(self):
+        """Apply pending file changes on the Tk thread."""
+        if not self.watcher:
+            return
+        
+        changed = set()
+        while not self.watch_changes.empty():
+            changed |= self.watch_changes.get_nowait()
         
-        # Generate testbench
-        self.logic.generate_testbench(self.wave_canvas, timing_config)
+        if changed:
+            self._on_files_changed(changed)
+            self.watcher.set_paths(self.logic.get_watch_paths())
+        
+        self.root.after(200, self._poll_watch)
+    
+    def _on_files_changed(self, changed):
+        """Re-parse what changed and re-run the out of date stages."""
+        from core.stimulus import Stimulus
+        
+        ports_changed = self.logic.reload_changed(changed)
+        
+        if ports_changed or not self.wave_canvas:
+            # Keep the painted stimulus for ports that still exist
+            old_stimulus = Stimulus.from_canvas(self.wave_canvas) if self.wave_canvas else None
+            self._refresh_waveform_editor()
+            if old_stimulus and self.wave_canvas:
+                new_stimulus = old_stimulus.remap(self.logic.get_input_port_names(),
+                                                  self.logic.get_input_port_types())
+                self.wave_canvas.set_stimulus(new_stimulus.get_highlighted_segments(),
+                                              new_stimulus.get_highlighted_segments_value())
+        
+        if self.wave_canvas:
+            self.logic.generate_testbench(self.wave_canvas, self._get_timing_config(),
+                                          incremental=True, launch_viewer=False)
+            self._show_coverage()
     
     def _refresh_waveform_editor(self):
         """Create or recreate the waveform editor canvas."""
@@ -201,6 +336,20 @@ class VHDLTestbenchGUI:
 
         self.dynamic_widgets.append(self.wave_canvas)
 
+    def _report_startup(self):
+        """Print time to first window and quit."""
+        from utils.startup import elapsed_since_start
+        
+        self.root.update()
+        print(f"Time to first window: {elapsed_since_start() * 1000:.0f} ms")
+        self.root.destroy()
+
     def run(self):
         """Start the GUI main loop."""
-        self.root.mainloop()
+        if self.measure_startup:
+            self.root.after_idle(self._report_startup)
+        try:
+            self.root.mainloop()
+        finally:
+            if self.watcher:
+                self.watcher.stop()
@@ -0,0 +1,121 @@
+"""
+Headless runner for VHDL Testbench Generator.
+Generates and simulates without a window, optionally in watch mode.
+"""
+import os
+import time
+import queue
+
+from app_logic import TestbenchLogic
+from core.stimulus import Stimulus
+from core.watch import FileWatcher
+
+
+DEFAULT_TIMING = {
+    'high_time': 10,
+    'low_time': 10,
+    'test_length': 400,
+    'segment_duration': 20
+}
+
+
+class HeadlessRunner:
+    """Drives TestbenchLogic from the command line."""
+
+    def __init__(self, file_path, stimulus_path=None, timing_config=None, save_golden=False):
+        self.logic = TestbenchLogic()
+        self.file_path = file_path or self.logic.get_default_vhdl_file()
+        self.stimulus_path = stimulus_path
+        self.timing_config = dict(DEFAULT_TIMING, **(timing_config or {}))
+        self.stimulus = None
+        self.save_golden = save_golden
+
+    def _load_stimulus(self):
+        """Load the stimulus file, or keep/remap the current stimulus."""
+        names = self.logic.get_input_port_names()
+        types = self.logic.get_input_port_types()
+
+        if self.stimulus_path and os.path.exists(self.stimulus_path):
+            self.stimulus = Stimulus.from_json(self.stimulus_path, names, types)
+        elif self.stimulus is None:
+            self.stimulus = Stimulus(names, types)
+        elif not self.stimulus.is_compatible(names, types):
+            print("Port list changed, remapping stimulus.")
+            self.stimulus = self.stimulus.remap(names, types)
+
+    def run_once(self):
+        """
+        Load, generate and simulate once.
+
+        Returns:
+            bool: True on success, False on errors or golden divergences
+        """
+        if self.logic.load_vhdl_file(self.file_path) is None:
+            return False
+        self._load_stimulus()
+        if not self.logic.generate_testbench(self.stimulus, self.timing_config, launch_viewer=False):
+            return False
+        if self.save_golden:
+            return self.logic.save_golden()
+        result = self.logic.last_golden_result if self.logic.check_golden else None
+        return not result or not (result['divergences'] or result['missing'] or result['extra'])
+
+    def watch(self, debounce=0.3):
+        """
+        Regenerate and re-simulate whenever the DUT, its components or
+        the stimulus file change. Runs until interrupted.
+
+        If the DUT cannot be loaded at first, its file is watched until
+        it appears.
+
+        Returns:
+            bool: False if there is nothing to watch
+        """
+        self.run_once()
+
+        paths = self._watch_paths()
+        if not paths or not os.path.isdir(os.path.dirname(paths[0])):
+            print(f"ERROR: Nothing to watch, {self.file_path or 'no VHDL file'} cannot be watched.")
+            return False
+
+        changes = queue.Queue()
+        watcher = FileWatcher(paths, changes.put, debounce=debounce)
+        watcher.start()
+        print(f"Watching {len(paths)} file(s) ({watcher.backend}). Press Ctrl+C to stop.")
+
+        try:
+            while True:
+                changed = changes.get()
+                # Merge anything that arrived while we were busy
+                while not changes.empty():
+                    changed |= changes.get_nowait()
+                self._on_change(changed)
+                watcher.set_paths(self._watch_paths())
+        except KeyboardInterrupt:
+            print("Watch stopped.")
+        finally:
+            watcher.stop()
+        return True
+
+    def _watch_paths(self):
+        # Until the DUT loads, watch the file that was asked for
+        paths = self.logic.get_watch_paths()
+        if not paths and self.file_path:
+            paths = [os.path.abspath(self.file_path)]
+        if self.stimulus_path:
+            paths.append(os.path.abspath(self.stimulus_path))
+        return paths
+
+    def _on_change(self, changed):
+        print(f"\nChanged: {', '.join(sorted(os.path.basename(p) for p in changed))}")
+        start = time.perf_counter()
+
+        if self.logic.component_file_path:
+            self.logic.reload_changed(changed)
+            self._load_stimulus()
+            self.logic.generate_testbench(self.stimulus, self.timing_config,
+                                          incremental=True, launch_viewer=False)
+        else:
+            self.run_once()
+
+        print(f"Rebuilt in {time.perf_counter() - start:.2f} s")
@@ -4,11 +4,18 @@ Handles configuration, VHDL parsing, testbench generation, and simulation.
 """
 import os
 import sys
-import shutil
+import hashlib
 
 from core.ports import extract, extract_component_names
-from core.generate import make_copy, replace
-from core.command import run_ghdl_analyze, run_ghdl_elaborate, run_ghdl_simulate, run_gtkwave
+from core.generate import make_copy, replace, STIMULUS_STYLES, DEFAULT_STIMULUS_STYLE
+from core.golden import golden_path, store_golden, compare_dumps, print_report
+from core.coverage import compute_coverage, port_signals, port_coverage, print_coverage
+from core.command import run_gtkwave
+from core.libcache import prepare_libraries
+from core.simulator import select_backend
+from core.tools import find_tool
+from utils.config import load_project_config
+from utils.trace import span, count
 
 
 class TestbenchLogic:
@@ -22,9 +29,12 @@ class TestbenchLogic:
         # Check if workspace exists
         os.makedirs(self.workspace_dir, exist_ok=True)
         
-        # Ghdl and gtkwave paths detection
-        self.ghdl = self._find_ghdl()
-        self.gtkwave = self._find_gtkwave()
+        # Simulator and gtkwave are detected on first use
+        self._simulator = None
+        self._simulator_key = None
+        self._pinned_simulator = None
+        self.simulator_override = None
+        self._gtkwave = None
         
         # States
         self.component_file_path = None
@@ -33,6 +43,37 @@ class TestbenchLogic:
         self.entity_name = None
         self.num_ports = []
         self.port_type = []
+        
+        # Incremental pipeline state: file path -> content digest at last analysis
+        self._analyzed = {}
+        self._elaborated = None
+        self._simulated = None
+        
+        # Directories of precompiled libraries passed to the simulator,
+        # the project's vvtg.json "libraries" are added from the shared cache
+        self.library_paths = []
+        self._linked_libraries = None
+        
+        # Stimulus emission style, None uses vvtg.json or the default
+        self.stimulus_style = None
+        
+        # Waveform format, None uses the simulator's default
+        self.dump_format = None
+        
+        # Compare each run against the stored golden dump (needs VCD)
+        self.check_golden = False
+        self.last_golden_result = None
+        
+        # Toggle/value coverage of each run's dump (needs VCD)
+        self.collect_coverage = False
+        self.last_coverage = None
+        
+        # Optional shared dict of parse results keyed by file digest
+        self.parse_cache = None
+        
+        # Outputs of the last successful generate_testbench call
+        self.last_testbench = None
+        self.last_wave_file = None
     
     def _get_base_dir(self):
         """
@@ -48,44 +89,77 @@ class TestbenchLogic:
             # Running as script - go up one level from src/
             return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    def _find_ghdl(self):
+    @property
+    def simulator(self):
+        """
+        Simulator backend for the loaded project, selected lazily.
+        
+        The choice comes from simulator_override, then the project's
+        vvtg.json, and defaults to the fastest simulator installed.
         """
-        Find GHDL executable.
+        if self._pinned_simulator:
+            return self._pinned_simulator
+        key = self._simulator_settings()
+        if self._simulator_key != key:
+            self._select_simulator(key)
+        return self._simulator
+    
+    @property
+    def gtkwave(self):
+        """GTKWave executable path, discovered lazily."""
+        if self._gtkwave is None:
+            self._gtkwave = self._find_gtkwave() or ""
+        return self._gtkwave or None
+    
+    def set_simulator(self, backend):
         """
-        # Try system PATH first
-        system_ghdl = shutil.which("ghdl")
-        if system_ghdl:
-            return system_ghdl
-        else : 
-            print("GHDL not found in system PATH.")
+        Use an already detected backend instead of selecting one.
         
+        Lets several TestbenchLogic instances share one discovery result.
+        """
+        self._pinned_simulator = backend
+    
+    def refresh_tools(self):
+        """Rediscover the simulator and GTKWave, bypassing the tool cache."""
+        self._select_simulator(self._simulator_settings(), refresh=True)
+        self._gtkwave = self._find_gtkwave(refresh=True) or ""
+    
+    def _simulator_settings(self):
+        if self.component_file_path:
+            settings = load_project_config(os.path.dirname(self.component_file_path))
+        else:
+            settings = {}
+        name = self.simulator_override or settings.get('simulator', 'auto')
+        return (name, settings.get('std'), settings.get('optimize'))
+    
+    def _select_simulator(self, key, refresh=False):
+        name, std, optimize = key
+        self._simulator = select_backend(self.base_dir, name, std, optimize, refresh=refresh)
+        self._simulator_key = key
         
-        if sys.platform.startswith("win"):
-            ghdl_exe = os.path.join(self.base_dir, "ghdl/bin", "ghdl.exe")
+        # Units analyzed by another simulator or standard are of no use
+        self._analyzed = {}
+        self._elaborated = None
+        self._simulated = None
+        
+        if self._simulator:
+            print(f"Simulator: {self._simulator.describe()}")
         else:
-            ghdl_exe = os.path.join(self.base_dir, "ghdl/bin", "ghdl")
-
-        return ghdl_exe if os.path.exists(ghdl_exe) else None
-
-    def _find_gtkwave(self):
+            print(f"Simulator '{name}' not found.")
+    
+    def _find_gtkwave(self, refresh=False):
         """
         Find GTKWave executable.
         
         Returns:
             str: Path to GTKWave or None
         """
-        # Try system PATH 
-        system_gtkwave = shutil.which("gtkwave")
-        if system_gtkwave:
-            return system_gtkwave
-        
-        # Try bundled version
         if sys.platform.startswith("win"):
             gtkwave_exe = os.path.join(self.base_dir, "gtkwave/gtkwave64/bin", "gtkwave.exe")
         else:
             gtkwave_exe = os.path.join(self.base_dir, "gtkwave/gtkwave64/bin", "gtkwave")
 
-        return gtkwave_exe if os.path.exists(gtkwave_exe) else None
+        return find_tool("gtkwave", [gtkwave_exe], refresh=refresh)['path']
 
     def get_default_vhdl_file(self):
         """
@@ -114,9 +188,18 @@ class TestbenchLogic:
             # Store absolute path
             self.component_file_path = os.path.abspath(file_path)
             
-            # Parse VHDL file
-            self.file_data = extract(file_path)
-            self.used_component = extract_component_names(file_path)
+            # Parse VHDL file, reusing a cached result for identical content
+            with span("parse", file=os.path.basename(file_path)) as s:
+                digest = self._file_digest(file_path) if self.parse_cache is not None else None
+                if digest and digest in self.parse_cache:
+                    self.file_data, self.used_component = self.parse_cache[digest]
+                    s.set(cached=True)
+                else:
+                    self.file_data = extract(file_path)
+                    self.used_component = extract_component_names(file_path)
+                    if digest:
+                        self.parse_cache[digest] = (self.file_data, self.used_component)
+                s.set(ports=len(self.file_data[0]) + len(self.file_data[1]))
             self.port_type = list(self.file_data[0].values())
             self.num_ports = list(self.file_data[0].keys())
             self.entity_name = self.file_data[2]
@@ -128,6 +211,54 @@ class TestbenchLogic:
             print(f"ERROR loading file: {e}")
             return None
 
+    def resolve_component_files(self):
+        """
+        Resolve the component names used by the DUT to file paths.
+        
+        Components are expected next to the DUT as <name>.vhd.
+        
+        Returns:
+            list: Absolute paths of component files, in analysis order
+        """
+        if not self.component_file_path:
+            return []
+        component_dir = os.path.dirname(self.component_file_path)
+        return [os.path.join(component_dir, name + ".vhd") for name in self.used_component or []]
+    
+    def get_watch_paths(self):
+        """
+        Get the files watch mode should monitor.
+        
+        Returns:
+            list: DUT file followed by its resolved component files
+        """
+        if not self.component_file_path:
+            return []
+        return [self.component_file_path] + self.resolve_component_files()
+    
+    def reload_changed(self, changed_paths):
+        """
+        Re-parse only the files that changed on disk.
+        
+        Component files are not parsed, they only need re-analysis which
+        the incremental pipeline detects by content. The DUT is re-parsed
+        if it is among the changed paths.
+        
+        Args:
+            changed_paths: Iterable of absolute paths reported by the watcher
+            
+        Returns:
+            bool: True if the input port list (names or types) changed
+        """
+        changed = {os.path.abspath(p) for p in changed_paths}
+        if self.component_file_path not in changed:
+            return False
+        
+        old_ports = (list(self.num_ports), list(self.port_type))
+        if self.load_vhdl_file(self.component_file_path) is None:
+            return False
+        return old_ports != (self.num_ports, self.port_type)
+    
     def get_input_port_names(self):
         """
         Get list of input port names.
@@ -140,17 +271,29 @@ class TestbenchLogic:
         """
         return self.port_type
     
-    def generate_testbench(self, waveform_canvas, timing_config):
+    def generate_testbench(self, waveform_canvas, timing_config, incremental=False, launch_viewer=True,
+                           simulate=True):
         """
         Generate testbench file and run simulation.
+        
+        Args:
+            waveform_canvas: WaveGenCanvas or Stimulus providing the stimulus
+            timing_config: Dict with high_time, low_time, test_length, segment_duration
+            incremental: Only re-run pipeline stages whose inputs changed
+            launch_viewer: Open GTKWave after a successful run
+            simulate: Set False to only write the testbench file
         """
+        with span("generate", incremental=incremental, simulate=simulate):
+            return self._generate_testbench(waveform_canvas, timing_config, incremental, launch_viewer, simulate)
+    
+    def _generate_testbench(self, waveform_canvas, timing_config, incremental, launch_viewer, simulate):
         try:
             if not waveform_canvas:
                 print("ERROR: Waveform not initialized.")
                 return False
             
-            if not self.ghdl:
-                print("ERROR: GHDL not found.")
+            if simulate and not self.simulator:
+                print("ERROR: No simulator found (GHDL or NVC).")
                 return False
             
             if not self.component_file_path:
@@ -164,37 +307,38 @@ class TestbenchLogic:
             # Setup paths
             component_dir = os.path.dirname(self.component_file_path)
             tb_file_path = os.path.join(component_dir, self.entity_name[1] + '.vhd')
-            wave_file = os.path.join(component_dir, self.entity_name[0] + '_wave.ghw')
-            
-            # Generate testbench template
-            make_copy(os.path.join(component_dir, self.entity_name[1]))
             
-            # Replace entity placeholders
-            replace(tb_file_path, 'ENTITY_NAME_TB', self.entity_name[1])
-            replace(tb_file_path, 'ENTITY_NAME', self.entity_name[0])
+            with span("render", entity=self.entity_name[0]) as s:
+                self._write_testbench(tb_file_path, waveform_canvas, timing_config)
+                s.set(bytes=os.path.getsize(tb_file_path))
+            self.last_testbench = tb_file_path
             
-            # Replace timing parameters
-            replace(tb_file_path, 'XHIGH_TIME', str(timing_config['high_time']))
-            replace(tb_file_path, 'XLOW_TIME', str(timing_config['low_time']))
-            replace(tb_file_path, 'XTEST_LENGTH', str(timing_config['test_length']))
-            replace(tb_file_path, 'XCHANGE_TIME', str(timing_config['segment_duration']))
+            if not simulate:
+                print(f"Testbench written: {tb_file_path}")
+                return True
             
-            # Generate port declarations
-            self._generate_port_strings(tb_file_path)
-            
-            # Generate stimulus loop
-            self._generate_stimulus_loop(tb_file_path, waveform_canvas, timing_config)
+            needs_vcd = self.check_golden or self.collect_coverage
+            dump_format = self.dump_format or ("vcd" if needs_vcd else None)
+            wave_file = os.path.join(component_dir,
+                                     self.simulator.wave_file_name(self.entity_name[0], dump_format))
             
             # Run simulation
-            success = self._run_simulation(component_dir, tb_file_path, wave_file)
+            success = self._run_simulation(component_dir, tb_file_path, wave_file, incremental)
             
             if success:
                 print(f"\n✓ Simulation complete!")
                 print(f"  Testbench: {tb_file_path}")
                 print(f"  Waveform:  {wave_file}\n")
+                self.last_wave_file = wave_file
+                
+                if self.check_golden:
+                    self.compare_golden()
+                if self.collect_coverage:
+                    self.compute_coverage()
                 
                 # Try to launch GTKWave
-                self._launch_gtkwave(wave_file)
+                if launch_viewer:
+                    self._launch_gtkwave(wave_file)
             
             return success
             
@@ -204,6 +348,112 @@ class TestbenchLogic:
             traceback.print_exc()
             return False
     
+    def save_golden(self):
+        """
+        Store the last simulated waveform as the golden reference.
+        
+        Golden dumps are VCD; if the last run dumped another format (GHW
+        by default with GHDL), the last testbench is simulated once more
+        with a VCD dump.
+        
+        Returns:
+            bool: True on success
+        """
+        if not self.last_wave_file or not os.path.exists(self.last_wave_file):
+            print("ERROR: No waveform to save, run a simulation first.")
+            return False
+        try:
+            if not self.last_wave_file.endswith(".vcd"):
+                component_dir = os.path.dirname(self.component_file_path)
+                wave_file = os.path.join(component_dir, self.simulator.wave_file_name(self.entity_name[0], "vcd"))
+                print("Simulating again with a VCD dump for the golden reference.")
+                self._run_simulation(component_dir, self.last_testbench, wave_file, incremental=True)
+                self.last_wave_file = wave_file
+            store_golden(self.last_wave_file, self._golden_file())
+            return True
+        except Exception as e:
+            print(f"ERROR: {e}")
+            return False
+    
+    def compare_golden(self):
+        """
+        Compare the last simulated waveform with the golden reference.
+        
+        Ignore patterns, time tolerance and report length come from
+        golden_ignore, golden_tolerance and golden_max in vvtg.json.
+        
+        Returns:
+            dict: Result of core.golden.compare_dumps, or None if there is
+            nothing to compare
+        """
+        self.last_golden_result = None
+        golden_file = self._golden_file()
+        if not os.path.exists(golden_file):
+            print(f"No golden waveform yet ({golden_file}), save one first.")
+            return None
+        if not self.last_wave_file or not self.last_wave_file.endswith(".vcd"):
+            print("ERROR: Golden comparison needs a VCD waveform.")
+            return None
+        
+        settings = load_project_config(os.path.dirname(self.component_file_path))
+        with span("golden", file=os.path.basename(self.last_wave_file)):
+            result = compare_dumps(golden_file, self.last_wave_file,
+                                   ignore=settings.get('golden_ignore', ()),
+                                   time_tolerance=settings.get('golden_tolerance', 0),
+                                   max_divergences=settings.get('golden_max', 10))
+        print_report(result, golden_file)
+        self.last_golden_result = result
+        return result
+    
+    def compute_coverage(self):
+        """
+        Compute toggle and value coverage of the last waveform's ports.
+        
+        Returns:
+            dict: Port name -> core.coverage.SignalCoverage for the input
+            and output ports found in the dump, or None without a VCD dump
+        """
+        self.last_coverage = None
+        if not self.last_wave_file or not self.last_wave_file.endswith(".vcd"):
+            print("ERROR: Coverage needs a VCD waveform.")
+            return None
+        
+        ports = list(self.file_data[0]) + list(self.file_data[1])
+        with span("coverage", file=os.path.basename(self.last_wave_file)):
+            # DUT internals would only be counted to be thrown away
+            signals = compute_coverage(self.last_wave_file, include=port_signals(ports, top=self.entity_name[1]))
+            self.last_coverage = port_coverage(signals, ports, top=self.entity_name[1])
+        print_coverage(self.last_coverage)
+        return self.last_coverage
+    
+    def _golden_file(self):
+        return golden_path(os.path.dirname(self.component_file_path), self.entity_name[1])
+    
+    def _write_testbench(self, tb_file_path, waveform_canvas, timing_config):
+        """
+        Write the testbench file from the template.
+        """
+        tb_base = tb_file_path[:-len('.vhd')]
+        
+        # Generate testbench template
+        make_copy(tb_base)
+        
+        # Replace entity placeholders
+        replace(tb_file_path, 'ENTITY_NAME_TB', self.entity_name[1])
+        replace(tb_file_path, 'ENTITY_NAME', self.entity_name[0])
+        
+        # Replace timing parameters
+        replace(tb_file_path, 'XHIGH_TIME', str(timing_config['high_time']))
+        replace(tb_file_path, 'XLOW_TIME', str(timing_config['low_time']))
+        replace(tb_file_path, 'XTEST_LENGTH', str(timing_config['test_length']))
+        replace(tb_file_path, 'XCHANGE_TIME', str(timing_config['segment_duration']))
+        
+        # Generate port declarations
+        self._generate_port_strings(tb_file_path)
+        
+        # Generate stimulus loop
+        self._generate_stimulus_loop(tb_file_path, waveform_canvas, timing_config)
+    
     def _generate_port_strings(self, tb_file_path):
         """
         Generate and replace port-related strings in testbench.
@@ -231,10 +481,33 @@ class TestbenchLogic:
         replace(tb_file_path, 'XSIGNALS', signal_string)
         replace(tb_file_path, 'XPORTMAP', portmap_string)
     
+    def get_stimulus_style(self):
+        """
+        Get the stimulus emission style for the loaded project.
+        
+        Returns:
+            str: One of STIMULUS_STYLES
+        """
+        style = self.stimulus_style
+        if not style and self.component_file_path:
+            style = load_project_config(os.path.dirname(self.component_file_path)).get('stimulus_style')
+        style = style or DEFAULT_STIMULUS_STYLE
+        if style not in STIMULUS_STYLES:
+            print(f"Unknown stimulus style '{style}', using {DEFAULT_STIMULUS_STYLE}")
+            style = DEFAULT_STIMULUS_STYLE
+        return style
+    
     def _generate_stimulus_loop(self, tb_file_path, waveform_canvas, timing_config):
         """
         Generate stimulus process loop from waveform data.
         """
+        style = self.get_stimulus_style()
+        if style == "delta":
+            return self._generate_stimulus_delta(tb_file_path, waveform_canvas, timing_config)
+        if style == "table":
+            return self._generate_stimulus_table(tb_file_path, waveform_canvas, timing_config)
+        
+        replace(tb_file_path, 'XSTIMDECL', '')
         segments = waveform_canvas.get_highlighted_segments()
         segment_value = waveform_canvas.get_highlighted_segments_value()
         
@@ -257,28 +530,183 @@ class TestbenchLogic:
         
         replace(tb_file_path, 'XLOOP', loop_string)
     
-    def _run_simulation(self, component_dir, tb_file_path, wave_file):
+    def _segment_literals(self, waveform_canvas, num_segments):
+        """
+        Get the VHDL literal of every port in every segment.
+        
+        Returns:
+            list: One list of num_segments literals per input port
+        """
+        segments = waveform_canvas.get_highlighted_segments()
+        segment_value = waveform_canvas.get_highlighted_segments_value()
+        
+        literals = []
+        for j, dtype in enumerate(self.port_type):
+            highlighted = set(segments[j])
+            if dtype == 'STD_LOGIC':
+                port = ["'1'" if i in highlighted else "'0'" for i in range(num_segments)]
+            else:
+                port = [f"\"{segment_value[j].get(i)}\"" if i in highlighted else "(others => '0')"
+                        for i in range(num_segments)]
+            literals.append(port)
+        return literals
+    
+    def _generate_stimulus_delta(self, tb_file_path, waveform_canvas, timing_config):
         """
-        Run GHDL analysis, elaboration, and simulation.
+        Generate a stimulus that only assigns ports whose value changes.
+        
+        Consecutive segments without changes become a single wait.
         """
-        original_cwd = os.getcwd()
-        print(f"Changing to directory: {component_dir}")
+        num_segments = int(timing_config['test_length'] / timing_config['segment_duration'])
+        literals = self._segment_literals(waveform_canvas, num_segments)
+        
+        # Signals start at '0' / (others => '0'), see _generate_port_strings
+        previous = ["'0'" if t == 'STD_LOGIC' else "(others => '0')" for t in self.port_type]
+        lines = []
+        idle = 0
+        for i in range(num_segments):
+            changes = [j for j in range(len(self.num_ports)) if literals[j][i] != previous[j]]
+            if changes and idle:
+                lines.append(self._wait_segments(idle))
+                idle = 0
+            for j in changes:
+                lines.append(f"{self.num_ports[j]}<= {literals[j][i]};")
+                previous[j] = literals[j][i]
+            idle += 1
+        if idle:
+            lines.append(self._wait_segments(idle))
         
+        replace(tb_file_path, 'XSTIMDECL', '')
+        replace(tb_file_path, 'XLOOP', "\n".join(lines) + "\n")
+    
+    def _wait_segments(self, count):
+        if count == 1:
+            return "wait for DATA_CHANGE_TIME;"
+        return f"wait for DATA_CHANGE_TIME * {count};"
+    
+    def _generate_stimulus_table(self, tb_file_path, waveform_canvas, timing_config):
+        """
+        Generate a stimulus stored in constant arrays and applied by a loop.
+        """
+        num_segments = int(timing_config['test_length'] / timing_config['segment_duration'])
+        if num_segments == 0 or not self.num_ports:
+            replace(tb_file_path, 'XSTIMDECL', '')
+            replace(tb_file_path, 'XLOOP', '')
+            return
+        literals = self._segment_literals(waveform_canvas, num_segments)
+        
+        decl_lines = []
+        assign_lines = []
+        for j, (name, dtype) in enumerate(zip(self.num_ports, self.port_type)):
+            if num_segments == 1:
+                # A positional aggregate needs at least two elements
+                aggregate = f"(0 => {literals[j][0]})"
+            else:
+                aggregate = "(" + ", ".join(literals[j]) + ")"
+            # Generated names carry a prefix so no port can clash with them
+            decl_lines.append(f"type vvtg_stim_{name}_t is array (0 to {num_segments - 1}) of {dtype};")
+            decl_lines.append(f"constant vvtg_stim_{name} : vvtg_stim_{name}_t := {aggregate};")
+            assign_lines.append(f"    {name}<= vvtg_stim_{name}(vvtg_seg);")
+        
+        loop_string = (f"for vvtg_seg in 0 to {num_segments - 1} loop\n"
+                       + "\n".join(assign_lines)
+                       + "\n    wait for DATA_CHANGE_TIME;\nend loop;\n")
+        
+        replace(tb_file_path, 'XSTIMDECL', "\n".join(decl_lines))
+        replace(tb_file_path, 'XLOOP', loop_string)
+    
+    def _run_simulation(self, component_dir, tb_file_path, wave_file, incremental=False):
+        """
+        Run analysis, elaboration, and simulation with the selected simulator.
+        
+        In incremental mode a file is only re-analyzed if its content
+        changed since the last analysis, or if a file analyzed before it
+        was. Elaboration and simulation are skipped when nothing was
+        re-analyzed and the waveform is still on disk.
+        """
+        print(f"Working directory: {component_dir}")
+        
+        # Tools run with cwd set instead of os.chdir() so several
+        # pipelines can run in one process (see app_daemon)
         try:
-            os.chdir(component_dir)
+            lib_paths = self.library_paths + self._project_libraries(component_dir)
             
-            # GHDL workflow
-            for i in self.used_component:
-                run_ghdl_analyze(self.ghdl, os.path.basename(i + ".vhd"))
-            run_ghdl_analyze(self.ghdl, os.path.basename(self.component_file_path))
-            run_ghdl_analyze(self.ghdl, os.path.basename(tb_file_path))
-            run_ghdl_elaborate(self.ghdl, self.entity_name[1])
-            run_ghdl_simulate(self.ghdl, self.entity_name[1], os.path.basename(wave_file))
+            # A missing work library or rebuilt shared libraries invalidate
+            # everything analyzed before
+            if not self.simulator.has_work_library(component_dir) or lib_paths != self._linked_libraries:
+                self._analyzed = {}
+            self._linked_libraries = lib_paths
+            
+            # Simulator workflow
+            sources = self.resolve_component_files() + [self.component_file_path, tb_file_path]
+            stale = not incremental
+            for source in sources:
+                digest = self._file_digest(source)
+                if stale or self._analyzed.get(source) != digest:
+                    with span("analyze", file=os.path.basename(source)):
+                        self.simulator.analyze(os.path.basename(source), library_paths=lib_paths,
+                                               cwd=component_dir)
+                    self._analyzed[source] = digest
+                    stale = True
+                else:
+                    print(f"Up to date: {os.path.basename(source)}")
+            
+            if stale or self._elaborated != self.entity_name[1]:
+                with span("elaborate", top=self.entity_name[1]):
+                    self.simulator.elaborate(self.entity_name[1], library_paths=lib_paths, cwd=component_dir)
+                self._elaborated = self.entity_name[1]
+                stale = True
+            
+            if stale or self._simulated != wave_file or not os.path.exists(wave_file):
+                with span("simulate", top=self.entity_name[1]) as s:
+                    self.simulator.run(self.entity_name[1], os.path.basename(wave_file),
+                                       library_paths=lib_paths, cwd=component_dir)
+                    dump_bytes = os.path.getsize(wave_file) if os.path.exists(wave_file) else 0
+                    s.set(dump_bytes=dump_bytes)
+                count("dump.bytes", dump_bytes)
+                self._simulated = wave_file
+            else:
+                print("Simulation up to date.")
             
             return True
             
-        finally:
-            os.chdir(original_cwd)
+        except Exception:
+            # Force a full rebuild after a failed run
+            self._analyzed = {}
+            self._elaborated = None
+            self._simulated = None
+            raise
+    
+    def _project_libraries(self, component_dir):
+        """
+        Analyze the project's shared libraries into the user-level cache.
+        
+        vvtg.json lists them in dependency order as name -> directory or
+        list of files, relative to the project:
+        
+            {"libraries": {"osvvm": "../lib/osvvm", "util": ["util/*.vhd"]}}
+        
+        Returns:
+            list: Cached library directories
+        """
+        libraries = load_project_config(component_dir).get('libraries')
+        if not libraries:
+            return []
+        with span("libraries", count=len(libraries)):
+            return prepare_libraries(self.simulator, libraries, base_dir=component_dir)
+    
+    def _file_digest(self, file_path):
+        """
+        Hash file content for incremental analysis.
+        
+        Returns:
+            str: Hex digest, or None if the file cannot be read
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except OSError:
+            return None
     
     def _launch_gtkwave(self, wave_file):
         """
@@ -289,7 +717,8 @@ class TestbenchLogic:
             return
         
         try:
-            run_gtkwave(self.gtkwave, wave_file)
+            with span("viewer", file=os.path.basename(wave_file)):
+                run_gtkwave(self.gtkwave, wave_file)
         except Exception as e:
             print(f"Note: Could not launch GTKWave")
             print(f"Open waveform manually with: gtkwave {wave_file}\n")
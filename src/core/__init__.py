@@ -2,6 +2,7 @@
 from .ports import extract
 from .generate import make_copy, replace
 from .command import run_ghdl_analyze, run_ghdl_elaborate, run_ghdl_simulate, run_gtkwave
+from .simulator import SimulatorBackend, GHDLBackend, NVCBackend, select_backend
 
 __all__ = [
     'extract',
@@ -10,5 +11,9 @@ __all__ = [
     'run_ghdl_analyze',
     'run_ghdl_elaborate',
     'run_ghdl_simulate',
-    'run_gtkwave'
+    'run_gtkwave',
+    'SimulatorBackend',
+    'GHDLBackend',
+    'NVCBackend',
+    'select_backend'
 ]
@@ -1,6 +1,21 @@
 import subprocess
+import sys
 import os
 
+def run_tool(cmd, cwd=None):
+    if sys.stdout is sys.__stdout__:
+        # Console: the tool writes to it directly, as it runs
+        subprocess.run(cmd, cwd=cwd, check=True)
+        return
+    # sys.stdout is redirected (daemon jobs, batch runs): pass the output
+    # on line by line; tools may print bytes that are not valid UTF-8
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, errors="replace", bufsize=1) as process:
+        for line in process.stdout:
+            print(line, end="")
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
 def run_ghdl_analyze(GHDL, file_path):
     cmd = [GHDL, "-a", file_path]
     subprocess.run(cmd, check=True)
@@ -19,5 +34,5 @@ def run_gtkwave(GTKWAVE, wave_file=None):
     if wave_file is None:
         wave_file = os.path.join("workspace", "wave.ghw")
     cmd = [GTKWAVE, wave_file]
-    subprocess.run(cmd, check=True)
-
+    # Don't block the caller (GUI, watch mode) while the viewer is open
+    return subprocess.Popen(cmd)
@@ -0,0 +1,234 @@
+"""
+Toggle and value coverage of simulation dumps.
+
+The dump is streamed once with core.vcd.VCDReader. Per signal only the
+current value, per-bit counters and a bounded value histogram are kept,
+so memory depends on the number and width of the signals, not on the
+length of the simulation.
+
+Bits are numbered from the right (LSB = 0), matching `downto 0` ports.
+"""
+import re
+
+from core.vcd import VCDReader, normalize_value
+
+
+# std_logic value -> occupancy slot (0, 1, Z, X); weak values count as strong
+STATES = "01zx"
+_SLOT = {'0': 0, '1': 1, 'z': 2, 'l': 0, 'h': 1}
+
+
+def _slot(bit):
+    return _SLOT.get(bit, 3)
+
+
+class SignalCoverage:
+    """Coverage counters of one dumped signal."""
+
+    def __init__(self, name, width, max_values=256):
+        self.name = name
+        self.width = width
+        self.max_values = max_values
+        # occupancy[bit][slot]: time spent in 0, 1, Z, X
+        self.occupancy = [[0, 0, 0, 0] for _ in range(width)]
+        self.rises = [0] * width
+        self.falls = [0] * width
+        # value -> number of times it was taken, at most max_values entries
+        self.histogram = {}
+        self.other_values = 0
+        self._value = None
+        self._since = 0
+
+    def update(self, time, value):
+        """Record a value change at time."""
+        old = self._value
+        if old is not None:
+            self._close(time)
+            # Strings are MSB first, counters are LSB first
+            last = self.width - 1
+            for i in range(self.width):
+                before = old[i]
+                after = value[i]
+                if before != after:
+                    if before in "0l" and after in "1h":
+                        self.rises[last - i] += 1
+                    elif before in "1h" and after in "0l":
+                        self.falls[last - i] += 1
+        if value != old:
+            if value in self.histogram:
+                self.histogram[value] += 1
+            elif len(self.histogram) < self.max_values:
+                self.histogram[value] = 1
+            else:
+                self.other_values += 1
+        self._value = value
+        self._since = time
+
+    def finish(self, end_time):
+        """Account the last value up to the end of the dump."""
+        if self._value is not None:
+            self._close(end_time)
+            self._since = end_time
+
+    def _close(self, time):
+        duration = time - self._since
+        if duration <= 0:
+            return
+        last = self.width - 1
+        for i, bit in enumerate(self._value):
+            self.occupancy[last - i][_slot(bit)] += duration
+
+    def toggled_bits(self):
+        """Bits that went both 0 -> 1 and 1 -> 0."""
+        return [b for b in range(self.width) if self.rises[b] and self.falls[b]]
+
+    def untoggled_bits(self):
+        return [b for b in range(self.width) if not (self.rises[b] and self.falls[b])]
+
+    @property
+    def toggle_coverage(self):
+        """Fraction of bits that toggled both ways."""
+        return len(self.toggled_bits()) / self.width if self.width else 1.0
+
+    def bit_occupancy(self, bit):
+        """
+        Returns:
+            dict: State ('0', '1', 'z', 'x') -> fraction of time in it
+        """
+        counts = self.occupancy[bit]
+        total = sum(counts)
+        return {state: (c / total if total else 0.0) for state, c in zip(STATES, counts)}
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'width': self.width,
+            'toggle_coverage': self.toggle_coverage,
+            'untoggled_bits': self.untoggled_bits(),
+            'rises': self.rises,
+            'falls': self.falls,
+            'occupancy': self.occupancy,
+            'histogram': self.histogram,
+            'other_values': self.other_values,
+        }
+
+
+def compute_coverage(dump_file, include=None, max_values=256):
+    """
+    Compute coverage of every signal in a VCD dump.
+
+    Args:
+        dump_file: VCD dump (.vcd or .vcd.gz)
+        include: Optional predicate on full signal names, others are skipped
+        max_values: Distinct values kept per histogram
+
+    Returns:
+        dict: Full signal name -> SignalCoverage
+    """
+    coverage = {}
+    with VCDReader(dump_file) as reader:
+        # One counter set per id code, shared by the names aliasing it
+        by_code = {}
+        for code, names in reader.signals.items():
+            names = [n for n in names if include is None or include(n)]
+            if not names:
+                continue
+            signal = SignalCoverage(names[0], reader.widths[code], max_values)
+            by_code[code] = signal
+            for name in names:
+                coverage[name] = signal
+
+        for time, changes in reader:
+            for code, value in changes:
+                signal = by_code.get(code)
+                # Real values have no bits to cover
+                if signal and b"." not in value:
+                    signal.update(time, normalize_value(value, signal.width).decode())
+
+    for signal in by_code.values():
+        signal.finish(reader.end_time)
+    return coverage
+
+
+def _base_name(full_name):
+    # "tb.uut.data_in[7:0]" -> "data_in"
+    return re.sub(r"\s*\[.*\]$", "", full_name.rsplit(".", 1)[-1]).lower()
+
+
+def _scope_name(full_name):
+    # "tb.uut.data_in" -> "uut"
+    parts = full_name.lower().split(".")
+    return parts[-2] if len(parts) > 1 else ""
+
+
+def port_signals(port_names, top=None):
+    """
+    Predicate for compute_coverage's include that keeps only the signals
+    port_coverage looks for: those named like a port, directly in the
+    testbench scope if top is given.
+    """
+    ports = {p.lower() for p in port_names}
+    scope = top.lower() if top else None
+
+    def include(full_name):
+        return _base_name(full_name) in ports and (scope is None or _scope_name(full_name) == scope)
+    return include
+
+
+def port_coverage(coverage, port_names, top=None):
+    """
+    Map dumped signals back onto ports.
+
+    The testbench drives every port through a signal of the same name, so
+    the signal directly in the testbench scope is preferred; otherwise the
+    shallowest signal with the port's name is used.
+
+    Args:
+        coverage: Result of compute_coverage
+        port_names: Port names to look up
+        top: Testbench entity name (scope of the driving signals)
+
+    Returns:
+        dict: Port name -> SignalCoverage, ports not found are left out
+    """
+    candidates = {}
+    for full_name, signal in coverage.items():
+        candidates.setdefault(_base_name(full_name), []).append((full_name, signal))
+
+    result = {}
+    for port in port_names:
+        matches = candidates.get(port.lower())
+        if not matches:
+            continue
+        if top:
+            direct = [m for m in matches if _scope_name(m[0]) == top.lower()]
+            matches = direct or matches
+        result[port] = min(matches, key=lambda m: (m[0].count("."), m[0]))[1]
+    return result
+
+
+def print_coverage(ports, max_histogram=8):
+    """Print port coverage in a readable form."""
+    if not ports:
+        print("No ports found in the dump.")
+        return
+    print("Coverage:")
+    for port, signal in ports.items():
+        untoggled = signal.untoggled_bits()
+        line = f"  {port:<20} toggle {signal.toggle_coverage * 100:5.1f}%"
+        if untoggled and signal.width > 1:
+            line += f"  untoggled bits: {', '.join(map(str, untoggled))}"
+        elif untoggled:
+            line += "  never toggled"
+        print(line)
+        # Bits that spent time in Z or X are usually worth a look
+        for bit in range(signal.width):
+            occupancy = signal.bit_occupancy(bit)
+            if occupancy['z'] or occupancy['x']:
+                label = f"bit {bit}" if signal.width > 1 else "value"
+                print(f"    {label}: Z {occupancy['z'] * 100:.1f}%  X {occupancy['x'] * 100:.1f}%")
+        if signal.width > 1:
+            common = sorted(signal.histogram.items(), key=lambda kv: kv[1], reverse=True)
+            shown = ", ".join(f"{value}: {n}" for value, n in common[:max_histogram])
+            more = len(common) - max_histogram + (1 if signal.other_values else 0)
+            print(f"    values: {shown}{f' (+{more} more)' if more > 0 else ''}")
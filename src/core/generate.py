@@ -1,3 +1,11 @@
+# Ways of emitting the stimulus process, see TestbenchLogic._generate_stimulus_loop.
+# "unrolled" assigns every port in every segment, "delta" only assigns ports
+# whose value changes and merges waits, "table" stores the stimulus in
+# constant arrays walked by a for loop.
+STIMULUS_STYLES = ("unrolled", "delta", "table")
+DEFAULT_STIMULUS_STYLE = "unrolled"
+
+
 def make_copy(destination_path):
     """Generate testbench template directly without file dependency."""
     try:
@@ -47,6 +55,7 @@ begin
 
     -- Stimulus process - applies test vectors
     stim_proc: process
+    XSTIMDECL
     begin
         wait for 10 ns;
 
@@ -0,0 +1,224 @@
+"""
+Golden-waveform regression.
+
+A known-good dump is stored gzip-compressed next to the testbench and
+later runs are compared against it. The comparison streams both dumps
+once, in time order, keeping only the current value of each signal, so
+memory does not grow with the dump size.
+"""
+import os
+import gzip
+import shutil
+import fnmatch
+
+from core.vcd import VCDReader, normalize_value
+
+
+GOLDEN_DIR = "golden"
+
+
+def golden_path(component_dir, testbench_name):
+    """
+    Returns:
+        str: Path of the stored golden dump for a testbench
+    """
+    return os.path.join(component_dir, GOLDEN_DIR, testbench_name + ".vcd.gz")
+
+
+def store_golden(dump_file, golden_file):
+    """
+    Store a dump as the golden reference, compressed while copying.
+    """
+    if not dump_file.endswith(".vcd"):
+        raise ValueError(f"Golden dumps must be VCD, got {os.path.basename(dump_file)}")
+    os.makedirs(os.path.dirname(golden_file), exist_ok=True)
+    tmp_file = golden_file + ".tmp"
+    with open(dump_file, 'rb') as src, gzip.open(tmp_file, 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.replace(tmp_file, golden_file)
+    print(f"Golden dump stored: {golden_file}")
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class Divergence:
+    """One point where the new dump departs from the golden one."""
+
+    def __init__(self, signal, time, expected, actual, end_time=None):
+        self.signal = signal
+        self.time = time
+        self.expected = expected
+        self.actual = actual
+        self.end_time = end_time
+
+    def __str__(self):
+        until = f" until {self.end_time}" if self.end_time is not None else ""
+        return f"{self.signal} @ {self.time}{until}: expected {self.expected}, got {self.actual}"
+
+
+def compare_dumps(golden_file, new_file, ignore=(), time_tolerance=0, max_divergences=10):
+    """
+    Compare two VCD dumps signal by signal.
+
+    A divergence is a period during which a signal has a different value
+    in the new dump. Periods no longer than time_tolerance are ignored,
+    which absorbs small shifts of an edge. Reading stops as soon as
+    max_divergences have been found.
+
+    Args:
+        golden_file: Known-good dump (.vcd or .vcd.gz)
+        new_file: Dump to check (.vcd or .vcd.gz)
+        ignore: fnmatch patterns of signal names to skip (e.g. '*.clk')
+        time_tolerance: Mismatch duration to tolerate, in dump time units
+        max_divergences: Number of divergences to report
+
+    Returns:
+        dict: {'divergences': [Divergence], 'missing': [names only in
+        the golden dump], 'extra': [names only in the new dump],
+        'complete': bool, True if both dumps were read to the end}
+    """
+    with VCDReader(golden_file) as old, VCDReader(new_file) as new:
+        old_names = old.names()
+        new_names = new.names()
+
+        def ignored(name):
+            return any(fnmatch.fnmatchcase(name, pattern) for pattern in ignore)
+
+        common = sorted(n for n in old_names if n in new_names and not ignored(n))
+        result = {
+            'divergences': [],
+            'missing': sorted(n for n in old_names if n not in new_names and not ignored(n)),
+            'extra': sorted(n for n in new_names if n not in old_names and not ignored(n)),
+            'complete': True,
+        }
+
+        # Signals are compared by name; id codes may differ between dumps.
+        # by_old[code] / by_new[code] list the compared signal indexes.
+        codes = [(old_names[name], new_names[name]) for name in common]
+        by_old = {}
+        by_new = {}
+        for index, (old_code, new_code) in enumerate(codes):
+            by_old.setdefault(old_code, []).append(index)
+            by_new.setdefault(new_code, []).append(index)
+        widths = [old.widths[old_names[name]] for name in common]
+        # Dumps of the same testbench usually have the same header, then
+        # byte-identical blocks cannot change whether signals match
+        same_header = old.signals == new.signals
+
+        # id code -> current raw value, per dump; values are only
+        # normalized when they differ
+        old_values = {}
+        new_values = {}
+        # signal index -> [start time, expected, actual, already reported]
+        open_mismatch = {}
+        # indexes of open mismatches not reported yet
+        unreported = set()
+        divergences = result['divergences']
+
+        def report(index, mismatch, end):
+            expected, actual = (_text(normalize_value(v, widths[index])) if v is not None else None
+                                for v in mismatch[1:3])
+            divergences.append(Divergence(common[index], mismatch[0], expected, actual, end))
+
+        def check(indexes, time):
+            for index in indexes:
+                old_code, new_code = codes[index]
+                expected = old_values.get(old_code)
+                actual = new_values.get(new_code)
+                if expected != actual and expected is not None and actual is not None:
+                    width = widths[index]
+                    if normalize_value(expected, width) == normalize_value(actual, width):
+                        actual = expected
+                if expected == actual:
+                    mismatch = open_mismatch.pop(index, None)
+                    if mismatch:
+                        unreported.discard(index)
+                        if not mismatch[3] and time - mismatch[0] > time_tolerance:
+                            report(index, mismatch, time)
+                elif index not in open_mismatch:
+                    open_mismatch[index] = [time, expected, actual, False]
+                    unreported.add(index)
+
+        def expire(time):
+            # Report mismatches as soon as they outlast the tolerance, but
+            # keep them open so a lasting difference is reported only once
+            for index in list(unreported):
+                mismatch = open_mismatch[index]
+                if time - mismatch[0] > time_tolerance:
+                    mismatch[3] = True
+                    unreported.discard(index)
+                    report(index, mismatch, None)
+
+        def touched(changes, by_code):
+            return [index for code, _ in changes for index in by_code.get(code, ())]
+
+        # Walk both dumps block by block (one block per timestamp line)
+        parse = VCDReader.parse_block
+        old_iter = old.blocks()
+        new_iter = new.blocks()
+        old_step = next(old_iter, None)
+        new_step = next(new_iter, None)
+
+        while old_step or new_step:
+            if same_header and old_step and new_step and old_step == new_step:
+                # Fast path: the same changes at the same time, parsed once
+                time = old_step[0]
+                changes = parse(old_step[1])
+                old_values.update(changes)
+                new_values.update(changes)
+                if open_mismatch:
+                    check(touched(changes, by_old), time)
+                old_step = next(old_iter, None)
+                new_step = next(new_iter, None)
+            else:
+                if new_step is None or (old_step and old_step[0] < new_step[0]):
+                    time = old_step[0]
+                else:
+                    time = new_step[0]
+
+                indexes = []
+                if old_step and old_step[0] == time:
+                    changes = parse(old_step[1])
+                    old_values.update(changes)
+                    indexes += touched(changes, by_old)
+                    old_step = next(old_iter, None)
+                if new_step and new_step[0] == time:
+                    changes = parse(new_step[1])
+                    new_values.update(changes)
+                    indexes += touched(changes, by_new)
+                    new_step = next(new_iter, None)
+                check(indexes, time)
+
+            if unreported:
+                expire(time)
+
+            if len(divergences) >= max_divergences:
+                result['complete'] = old_step is None and new_step is None
+                break
+        else:
+            # Whatever still differs at the end of both dumps diverged for good
+            for index in unreported:
+                report(index, open_mismatch[index], None)
+
+        divergences.sort(key=lambda d: d.time)
+        del divergences[max_divergences:]
+        return result
+
+
+def print_report(result, golden_file):
+    """Print a comparison result in a readable form."""
+    if not result['divergences'] and not result['missing'] and not result['extra']:
+        print(f"✓ Waveform matches golden ({os.path.basename(golden_file)})")
+        return
+
+    print(f"✗ Waveform differs from golden ({os.path.basename(golden_file)})")
+    for name in result['missing']:
+        print(f"  missing signal: {name}")
+    for name in result['extra']:
+        print(f"  new signal:     {name}")
+    for divergence in result['divergences']:
+        print(f"  {divergence}")
+    if not result['complete']:
+        print("  (stopped after the first divergences)")
@@ -0,0 +1,203 @@
+"""
+Shared cache of precompiled VHDL libraries.
+
+Vendor and utility libraries are analyzed once per machine instead of
+once per project. Each library gets its own directory under
+<cache>/libs/<toolchain>/<name>-<key>/, where the toolchain part covers
+the simulator, its version, code generator, VHDL standard and
+optimization level, and the key hashes the library's sources together
+with the keys of the libraries listed before it (which it may use).
+The sources are copied into the entry, so it stays valid when the
+original project moves or is deleted.
+
+The returned directories are passed to the simulator as -P (GHDL) or
+-L (NVC) library paths.
+"""
+import os
+import time
+import glob
+import shutil
+import hashlib
+
+from utils.config import get_config_dir
+
+
+VHDL_EXTENSIONS = (".vhd", ".vhdl")
+STAMP_FILE = "ready"
+LOCK_TIMEOUT = 600
+
+# (path, mtime, size) -> sha1, so unchanged sources are not re-read
+_digests = {}
+
+
+class LibraryError(Exception):
+    """Raised when a shared library cannot be analyzed."""
+
+
+def get_cache_root():
+    """
+    Returns:
+        str: Directory of the shared library cache
+    """
+    return os.path.join(get_config_dir(), "libs")
+
+
+def toolchain_id(backend):
+    """
+    Name of the cache subdirectory for a configured backend.
+
+    Libraries analyzed by another simulator version, code generator,
+    standard or optimization level are not compatible.
+    """
+    parts = [backend.name, backend.version or "unknown"]
+    if backend.capabilities.get('backend'):
+        parts.append(backend.capabilities['backend'])
+    parts.append(backend.std or "default")
+    if backend.optimize is not None:
+        parts.append(f"O{backend.optimize}")
+    return "-".join(str(p).replace(os.sep, "_") for p in parts)
+
+
+def library_sources(spec, base_dir=""):
+    """
+    Resolve a library source spec to a list of files.
+
+    Args:
+        spec: Directory of VHDL files, or a list of files / glob patterns
+        base_dir: Directory relative paths are resolved against
+
+    Returns:
+        list: Absolute source paths; directories are sorted by name,
+        lists keep their order
+    """
+    if isinstance(spec, str):
+        source_dir = os.path.join(base_dir, spec)
+        if not os.path.isdir(source_dir):
+            raise LibraryError(f"Library directory not found: {source_dir}")
+        return sorted(os.path.abspath(os.path.join(source_dir, f)) for f in os.listdir(source_dir)
+                      if f.lower().endswith(VHDL_EXTENSIONS))
+
+    sources = []
+    for pattern in spec:
+        matches = sorted(glob.glob(os.path.join(base_dir, pattern)))
+        if not matches:
+            raise LibraryError(f"Library source not found: {pattern}")
+        sources += [os.path.abspath(m) for m in matches]
+    return sources
+
+
+def _source_digest(path):
+    stat = os.stat(path)
+    stamp = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(stamp)
+    if digest is None:
+        with open(path, 'rb') as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+        _digests[stamp] = digest
+    return digest
+
+
+def library_key(name, sources, dependency_keys=()):
+    """
+    Hash a library's name, source names and contents and the keys of
+    the libraries it may depend on.
+
+    Returns:
+        str: Short hex key
+    """
+    digest = hashlib.sha1(name.lower().encode())
+    for key in dependency_keys:
+        digest.update(key.encode())
+    for source in sources:
+        digest.update(os.path.basename(source).encode())
+        digest.update(_source_digest(source).encode())
+    return digest.hexdigest()[:16]
+
+
+def prepare_libraries(backend, libraries, base_dir="", cache_root=None):
+    """
+    Make sure every library is analyzed in the shared cache.
+
+    Args:
+        backend: Configured SimulatorBackend
+        libraries: Dict of library name -> source spec (see
+            library_sources), in dependency order
+        base_dir: Directory relative source specs are resolved against
+        cache_root: Cache directory, defaults to get_cache_root()
+
+    Returns:
+        list: Library directories to pass as library_paths
+
+    Raises:
+        LibraryError: If a library's sources are missing or do not analyze
+    """
+    root = os.path.join(cache_root or get_cache_root(), toolchain_id(backend))
+    paths = []
+    keys = []
+    for name, spec in libraries.items():
+        sources = library_sources(spec, base_dir)
+        key = library_key(name, sources, keys)
+        entry = os.path.join(root, f"{name.lower()}-{key}")
+        if not os.path.exists(os.path.join(entry, STAMP_FILE)):
+            _build_entry(backend, name, sources, entry, paths)
+        else:
+            print(f"Library {name}: cached")
+        paths.append(entry)
+        keys.append(key)
+    return paths
+
+
+def _build_entry(backend, name, sources, entry, library_paths):
+    """Analyze one library into its cache entry, one process at a time."""
+    lock = entry + ".lock"
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    while True:
+        try:
+            os.mkdir(lock)
+            break
+        except FileExistsError:
+            # Another process is analyzing the same library
+            if os.path.exists(os.path.join(entry, STAMP_FILE)):
+                return
+            try:
+                if time.time() - os.path.getmtime(lock) > LOCK_TIMEOUT:
+                    os.rmdir(lock)
+                    continue
+            except OSError:
+                continue
+            time.sleep(0.2)
+
+    try:
+        if os.path.exists(os.path.join(entry, STAMP_FILE)):
+            return
+        # Start over after an interrupted build
+        shutil.rmtree(entry, ignore_errors=True)
+        source_dir = os.path.join(entry, "src")
+        os.makedirs(source_dir)
+        copies = []
+        for source in sources:
+            copy = os.path.join(source_dir, os.path.basename(source))
+            shutil.copyfile(source, copy)
+            copies.append(copy)
+
+        # Repeated passes, so sources can be listed in any order; a pass
+        # that makes no progress ends the loop
+        pending = copies
+        while pending:
+            failed = []
+            for source in pending:
+                try:
+                    backend.analyze(source, library=name, library_paths=library_paths,
+                                    cwd=entry, work_dir=entry)
+                except Exception:
+                    failed.append(source)
+            if len(failed) == len(pending):
+                raise LibraryError(f"Library {name}: could not analyze "
+                                   f"{', '.join(os.path.basename(f) for f in failed)}")
+            pending = failed
+
+        with open(os.path.join(entry, STAMP_FILE), 'w') as file:
+            file.write(name)
+        print(f"Library {name}: analyzed {len(sources)} file(s) into {entry}")
+    finally:
+        os.rmdir(lock)
@@ -0,0 +1,268 @@
+"""
+Simulator backends.
+
+A backend wraps one VHDL simulator's command line behind the same
+analyze / elaborate / run operations, so the pipeline does not depend
+on GHDL's -a/-e/-r flags. Backends are selected per project, or
+automatically by picking the fastest simulator found on the machine.
+"""
+import os
+import re
+import sys
+import glob
+import subprocess
+
+from core.command import run_tool
+from core.tools import find_tool, probe_ghdl
+
+
+class SimulatorBackend:
+    """Base class for simulator backends."""
+
+    name = None
+    # Waveform formats the simulator can dump, first is the default
+    dump_formats = ()
+    # Higher is faster, used by automatic selection
+    speed_rank = 0
+
+    def __init__(self, path, capabilities=None, std=None, optimize=None):
+        """
+        Args:
+            path: Simulator executable
+            capabilities: Dict from the tool probe (version, backend, ...)
+            std: VHDL standard as a two digit year ('93', '02', '08')
+            optimize: Optimization level (0-3) or None for the default
+        """
+        self.path = path
+        self.capabilities = capabilities or {}
+        self.std = std
+        self.optimize = optimize
+
+    @classmethod
+    def detect(cls, base_dir, refresh=False):
+        """
+        Find the simulator on this machine.
+
+        Returns:
+            SimulatorBackend: Configured backend or None if not installed
+        """
+        raise NotImplementedError
+
+    @property
+    def version(self):
+        return self.capabilities.get('version')
+
+    @property
+    def dump_format(self):
+        return self.dump_formats[0]
+
+    def wave_file_name(self, entity_name, dump_format=None):
+        """Name of the dump file for an entity."""
+        if dump_format and dump_format not in self.dump_formats:
+            print(f"{self.name} cannot dump {dump_format}, using {self.dump_format}")
+            dump_format = None
+        return f"{entity_name}_wave.{dump_format or self.dump_format}"
+
+    def analyze(self, file_path, library="work", library_paths=(), cwd=None, work_dir=None):
+        """
+        Analyze one source file.
+
+        Args:
+            file_path: VHDL file, relative to cwd or absolute
+            library: Library the design units are put in
+            library_paths: Directories with other precompiled libraries
+            cwd: Working directory of the simulator process
+            work_dir: Directory to store library in (default: cwd)
+        """
+        raise NotImplementedError
+
+    def elaborate(self, top, library_paths=(), cwd=None):
+        raise NotImplementedError
+
+    def run(self, top, wave_file=None, library_paths=(), cwd=None):
+        raise NotImplementedError
+
+    def has_work_library(self, directory):
+        """
+        Check whether analyzed units exist in directory.
+
+        Returns:
+            bool: False if everything needs to be analyzed again
+        """
+        raise NotImplementedError
+
+    def describe(self):
+        """One line summary for logs."""
+        details = ", ".join(f"{k}={v}" for k, v in self.capabilities.items() if v)
+        return f"{self.name} ({details})" if details else self.name
+
+
+class GHDLBackend(SimulatorBackend):
+    """GHDL with the mcode, LLVM or GCC code generator."""
+
+    name = "ghdl"
+    dump_formats = ("ghw", "vcd", "fst")
+
+    @classmethod
+    def detect(cls, base_dir, refresh=False):
+        if sys.platform.startswith("win"):
+            bundled = os.path.join(base_dir, "ghdl/bin", "ghdl.exe")
+        else:
+            bundled = os.path.join(base_dir, "ghdl/bin", "ghdl")
+        tool = find_tool("ghdl", [bundled], probe=probe_ghdl, refresh=refresh)
+        if not tool['path']:
+            return None
+        return cls(tool['path'], tool['capabilities'])
+
+    @property
+    def speed_rank(self):
+        # mcode JIT-compiles in memory and runs slower than native code
+        return 2 if self.capabilities.get('backend') in ('llvm', 'gcc') else 1
+
+    def _common_options(self, library_paths=()):
+        options = []
+        if self.std:
+            options.append(f"--std={self.std}")
+        options += [f"-P{p}" for p in library_paths]
+        return options
+
+    def analyze(self, file_path, library="work", library_paths=(), cwd=None, work_dir=None):
+        cmd = [self.path, "-a"] + self._common_options(library_paths)
+        if library != "work":
+            cmd.append(f"--work={library}")
+        if work_dir:
+            cmd.append(f"--workdir={work_dir}")
+        # mcode ignores -O, only pass it to native code generators
+        if self.optimize is not None and self.capabilities.get('backend') in ('llvm', 'gcc'):
+            cmd.append(f"-O{self.optimize}")
+        run_tool(cmd + [file_path], cwd=cwd)
+
+    def elaborate(self, top, library_paths=(), cwd=None):
+        cmd = [self.path, "-e"] + self._common_options(library_paths)
+        if self.optimize is not None and self.capabilities.get('backend') in ('llvm', 'gcc'):
+            cmd.append(f"-O{self.optimize}")
+        run_tool(cmd + [top], cwd=cwd)
+
+    def run(self, top, wave_file=None, library_paths=(), cwd=None):
+        cmd = [self.path, "-r"] + self._common_options(library_paths) + [top]
+        if wave_file:
+            ext = os.path.splitext(wave_file)[1].lstrip(".")
+            option = {"ghw": "--wave", "vcd": "--vcd", "fst": "--fst"}.get(ext, "--wave")
+            cmd.append(f"{option}={wave_file}")
+        run_tool(cmd, cwd=cwd)
+
+    def has_work_library(self, directory):
+        return bool(glob.glob(os.path.join(directory, "work-obj*.cf")))
+
+
+def probe_nvc(path):
+    """
+    Read the version from `nvc --version`.
+
+    Returns:
+        dict: {'version': str}
+    """
+    result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+    match = re.search(r'nvc\s+(\S+)', result.stdout + result.stderr)
+    return {'version': match.group(1) if match else None}
+
+
+class NVCBackend(SimulatorBackend):
+    """NVC, compiles designs to native code through LLVM."""
+
+    name = "nvc"
+    dump_formats = ("fst", "vcd")
+    speed_rank = 3
+
+    @classmethod
+    def detect(cls, base_dir, refresh=False):
+        if sys.platform.startswith("win"):
+            bundled = os.path.join(base_dir, "nvc/bin", "nvc.exe")
+        else:
+            bundled = os.path.join(base_dir, "nvc/bin", "nvc")
+        tool = find_tool("nvc", [bundled], probe=probe_nvc, refresh=refresh)
+        if not tool['path']:
+            return None
+        return cls(tool['path'], tool['capabilities'])
+
+    def _global_options(self, library_paths=()):
+        # NVC takes global options before the command
+        options = []
+        if self.std:
+            options.append(f"--std={self.std}")
+        options += [f"-L{p}" for p in library_paths]
+        return options
+
+    def analyze(self, file_path, library="work", library_paths=(), cwd=None, work_dir=None):
+        cmd = [self.path] + self._global_options(library_paths)
+        if work_dir:
+            # NVC keeps each library in its own directory
+            cmd.append(f"--work={library}:{os.path.join(work_dir, library.lower())}")
+        elif library != "work":
+            cmd.append(f"--work={library}")
+        run_tool(cmd + ["-a", file_path], cwd=cwd)
+
+    def elaborate(self, top, library_paths=(), cwd=None):
+        cmd = [self.path] + self._global_options(library_paths) + ["-e"]
+        if self.optimize is not None:
+            cmd.append(f"-O{self.optimize}")
+        run_tool(cmd + [top], cwd=cwd)
+
+    def run(self, top, wave_file=None, library_paths=(), cwd=None):
+        cmd = [self.path] + self._global_options(library_paths) + ["-r", top]
+        if wave_file:
+            ext = os.path.splitext(wave_file)[1].lstrip(".")
+            cmd += [f"--wave={wave_file}", f"--format={ext if ext in self.dump_formats else 'fst'}"]
+        run_tool(cmd, cwd=cwd)
+
+    def has_work_library(self, directory):
+        return os.path.isdir(os.path.join(directory, "work"))
+
+
+BACKENDS = {
+    GHDLBackend.name: GHDLBackend,
+    NVCBackend.name: NVCBackend,
+}
+
+
+def detect_backends(base_dir, refresh=False):
+    """
+    Detect all installed simulators.
+
+    Returns:
+        list: Backends found, fastest first
+    """
+    found = []
+    for backend_class in BACKENDS.values():
+        backend = backend_class.detect(base_dir, refresh=refresh)
+        if backend:
+            found.append(backend)
+    return sorted(found, key=lambda b: b.speed_rank, reverse=True)
+
+
+def select_backend(base_dir, name="auto", std=None, optimize=None, refresh=False):
+    """
+    Select a simulator backend.
+
+    Args:
+        base_dir: Application base directory (for bundled tools)
+        name: 'ghdl', 'nvc' or 'auto' for the fastest one available
+        std: VHDL standard passed to the backend
+        optimize: Optimization level passed to the backend
+
+    Returns:
+        SimulatorBackend: Selected backend or None if none is installed
+    """
+    if name == "auto":
+        found = detect_backends(base_dir, refresh=refresh)
+        backend = found[0] if found else None
+    elif name in BACKENDS:
+        backend = BACKENDS[name].detect(base_dir, refresh=refresh)
+    else:
+        print(f"ERROR: Unknown simulator '{name}', expected one of: auto, {', '.join(BACKENDS)}")
+        return None
+
+    if backend:
+        backend.std = std
+        backend.optimize = optimize
+    return backend
@@ -0,0 +1,128 @@
+"""
+Canvas-independent stimulus storage.
+
+A Stimulus exposes the same getters as WaveGenCanvas so the testbench
+generator can be driven without a GUI (headless and watch mode).
+"""
+import json
+
+
+class Stimulus:
+    """Highlighted segments and vector values for a list of input ports."""
+
+    def __init__(self, port_names, port_types, segments=None, values=None):
+        self.port_names = list(port_names)
+        self.port_types = list(port_types)
+        self.highlighted_segments = segments if segments is not None else [[] for _ in self.port_names]
+        self.highlighted_segments_values = values if values is not None else [{} for _ in self.port_names]
+
+    @classmethod
+    def from_canvas(cls, waveform_canvas):
+        """
+        Snapshot the stimulus currently painted on a WaveGenCanvas.
+
+        Args:
+            waveform_canvas: WaveGenCanvas (or any object with the same getters)
+
+        Returns:
+            Stimulus: Independent copy of the canvas stimulus
+        """
+        segments = [list(s) for s in waveform_canvas.get_highlighted_segments()]
+        values = [dict(v) for v in waveform_canvas.get_highlighted_segments_value()]
+        return cls(waveform_canvas.num_overlays, waveform_canvas.data_types, segments, values)
+
+    @classmethod
+    def from_json(cls, file_path, port_names, port_types):
+        """
+        Load a stimulus file keyed by port name.
+
+        The file format is::
+
+            {"segments": {"write": [0, 1]},
+             "values":   {"data_in": {"0": "00001111"}}}
+
+        Ports missing from the file get an empty stimulus.
+
+        Args:
+            file_path: Path to JSON stimulus file
+            port_names: Input port names of the loaded entity
+            port_types: Input port types of the loaded entity
+
+        Returns:
+            Stimulus: Stimulus ordered like port_names
+        """
+        with open(file_path, 'r') as file:
+            data = json.load(file)
+        return cls.from_dict(data, port_names, port_types)
+
+    @classmethod
+    def from_dict(cls, data, port_names, port_types):
+        """
+        Build a stimulus from the decoded JSON format of from_json.
+
+        Returns:
+            Stimulus: Stimulus ordered like port_names
+        """
+        seg_data = data.get('segments', {})
+        val_data = data.get('values', {})
+
+        segments = []
+        values = []
+        for name in port_names:
+            port_values = {int(k): v for k, v in val_data.get(name, {}).items()}
+            port_segments = [int(i) for i in seg_data.get(name, [])]
+            for i in port_values:
+                if i not in port_segments:
+                    port_segments.append(i)
+            segments.append(port_segments)
+            values.append(port_values)
+
+        return cls(port_names, port_types, segments, values)
+
+    def to_json(self, file_path):
+        """Write the stimulus in the format read by from_json."""
+        data = {
+            'segments': {n: list(s) for n, s in zip(self.port_names, self.highlighted_segments)},
+            'values': {n: {str(k): v for k, v in vals.items()}
+                       for n, vals in zip(self.port_names, self.highlighted_segments_values) if vals},
+        }
+        with open(file_path, 'w') as file:
+            json.dump(data, file, indent=2)
+
+    def is_compatible(self, port_names, port_types):
+        """
+        Check whether this stimulus can drive a port list unchanged.
+
+        Returns:
+            bool: True if names and types match in order
+        """
+        return self.port_names == list(port_names) and self.port_types == list(port_types)
+
+    def remap(self, port_names, port_types):
+        """
+        Carry the stimulus over to a new port list.
+
+        Ports with the same name and type keep their segments, all other
+        ports start empty.
+
+        Returns:
+            Stimulus: Stimulus ordered like port_names
+        """
+        old = {(n, t): i for i, (n, t) in enumerate(zip(self.port_names, self.port_types))}
+        segments = []
+        values = []
+        for name, dtype in zip(port_names, port_types):
+            i = old.get((name, dtype))
+            if i is None:
+                segments.append([])
+                values.append({})
+            else:
+                segments.append(list(self.highlighted_segments[i]))
+                values.append(dict(self.highlighted_segments_values[i]))
+        return Stimulus(port_names, port_types, segments, values)
+
+    def get_highlighted_segments(self):
+        return self.highlighted_segments
+
+    def get_highlighted_segments_value(self):
+        return self.highlighted_segments_values
@@ -0,0 +1,108 @@
+"""
+External tool discovery with a persistent cache.
+
+Looking tools up on PATH and probing `--version` costs a few process
+spawns on every launch. Results are stored in tools.json in the user
+config directory and reused as long as the cached executable is
+unchanged and PATH is the same.
+"""
+import os
+import re
+import shutil
+import subprocess
+
+from utils.config import load_json, save_json
+
+
+CACHE_FILE = "tools.json"
+CACHE_VERSION = 1
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def _load_cache():
+    cache = load_json(CACHE_FILE, {})
+    if cache.get('version') != CACHE_VERSION:
+        cache = {'version': CACHE_VERSION, 'tools': {}}
+    return cache
+
+
+def find_tool(name, bundled_paths=(), probe=None, refresh=False):
+    """
+    Find an executable, using the cached result when still valid.
+
+    The system PATH is searched first, then the bundled locations.
+
+    Args:
+        name: Executable name (e.g. 'ghdl')
+        bundled_paths: Fallback paths to check in order
+        probe: Optional function path -> dict of capabilities, run only
+            when the tool is (re)discovered
+        refresh: Ignore the cache and rediscover
+
+    Returns:
+        dict: {'path': str or None, 'capabilities': dict}
+    """
+    cache = _load_cache()
+    env_path = os.environ.get("PATH", "")
+    bundled_paths = list(bundled_paths)
+    entry = cache['tools'].get(name)
+
+    if (not refresh and entry
+            and entry.get('env_path') == env_path
+            and entry.get('bundled') == bundled_paths):
+        # A cached miss is not trusted, the tool may have been installed since
+        path = entry.get('path')
+        if path and _stamp(path) == entry.get('stamp'):
+            return {'path': path, 'capabilities': entry.get('capabilities', {})}
+
+    path = shutil.which(name)
+    if not path:
+        path = next((p for p in bundled_paths if os.path.exists(p)), None)
+
+    capabilities = {}
+    if path and probe:
+        try:
+            capabilities = probe(path)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Could not probe {name}: {e}")
+
+    cache['tools'][name] = {
+        'path': path,
+        'stamp': _stamp(path) if path else None,
+        'env_path': env_path,
+        'bundled': bundled_paths,
+        'capabilities': capabilities,
+    }
+    save_json(CACHE_FILE, cache)
+
+    return {'path': path, 'capabilities': capabilities}
+
+
+def probe_ghdl(path):
+    """
+    Read version and code generator from `ghdl --version`.
+
+    Returns:
+        dict: {'version': str, 'backend': 'mcode' | 'llvm' | 'gcc' | None}
+    """
+    result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+    output = result.stdout + result.stderr
+
+    match = re.search(r'GHDL\s+(\S+)', output)
+    version = match.group(1) if match else None
+
+    lowered = output.lower()
+    backend = None
+    for key in ('mcode', 'llvm', 'gcc'):
+        if key in lowered:
+            backend = key
+            break
+
+    return {'version': version, 'backend': backend}
@@ -0,0 +1,315 @@
+"""
+Streaming VCD reader.
+
+Only the header (signal names and id codes) is kept in memory; value
+changes are yielded one timestamp at a time, so dumps of any size can be
+processed in bounded memory. Files ending in .gz are read through gzip.
+"""
+import gzip
+
+
+class VCDError(Exception):
+    """Raised for files that are not valid VCD."""
+
+
+def open_dump(file_path):
+    """Open a dump for binary reading, transparently decompressing .gz."""
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, 'rb')
+    return open(file_path, 'rb', buffering=1024 * 1024)
+
+
+# First byte of a value change line -> lowercased scalar value
+_SCALARS = {c: bytes([c]).lower() for c in b"01xzXZuUwWlLhH-"}
+_VECTORS = b"bBrR"
+_CHUNK_SIZE = 1024 * 1024
+
+
+class VCDReader:
+    """
+    Iterate over a VCD file.
+
+        reader = VCDReader("wave.vcd")
+        reader.signals          # id code (bytes) -> list of full names
+        for time, changes in reader:
+            ...                 # changes: list of (id code, value), bytes
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file = open_dump(file_path)
+        self.signals = {}
+        self.widths = {}
+        self.timescale = None
+        # Last timestamp seen, including ones without changes
+        self.end_time = 0
+        self._read_header()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def names(self):
+        """
+        Returns:
+            dict: Full signal name -> id code
+        """
+        return {name: code for code, names in self.signals.items() for name in names}
+
+    def _read_header(self):
+        scope = []
+        tokens = self._header_tokens()
+        for token in tokens:
+            if token == b"$scope":
+                next(tokens)  # scope type
+                scope.append(next(tokens).decode())
+                self._skip_to_end(tokens)
+            elif token == b"$upscope":
+                if scope:
+                    scope.pop()
+                self._skip_to_end(tokens)
+            elif token == b"$var":
+                next(tokens)  # var type
+                width = int(next(tokens))
+                code = next(tokens)
+                name = next(tokens).decode()
+                # Optional bit range, e.g. "data [7:0]"
+                rest = self._collect_to_end(tokens)
+                if rest and rest[0].startswith(b"["):
+                    name += rest[0].decode()
+                full_name = ".".join(scope + [name])
+                self.signals.setdefault(code, []).append(full_name)
+                self.widths[code] = width
+            elif token == b"$timescale":
+                self.timescale = b" ".join(self._collect_to_end(tokens)).decode()
+            elif token == b"$enddefinitions":
+                self._skip_to_end(tokens)
+                return
+            elif token.startswith(b"$"):
+                self._skip_to_end(tokens)
+        raise VCDError(f"{self.file_path}: no $enddefinitions, not a VCD file?")
+
+    def _header_tokens(self):
+        for line in self.file:
+            for token in line.split():
+                yield token
+
+    def _skip_to_end(self, tokens):
+        for token in tokens:
+            if token == b"$end":
+                return
+
+    def _collect_to_end(self, tokens):
+        collected = []
+        for token in tokens:
+            if token == b"$end":
+                break
+            collected.append(token)
+        return collected
+
+    def __iter__(self):
+        """
+        Yield (time, changes) for every timestamp with value changes.
+
+        Id codes and values are bytes, values lowercased. Changes before
+        the first timestamp (initial $dumpvars without a preceding #0)
+        are reported at time 0.
+        """
+        time = 0
+        changes = []
+        for block_time, block in self.blocks():
+            if block_time != time and changes:
+                yield time, changes
+                changes = []
+            time = block_time
+            changes += self.parse_block(block)
+        if changes:
+            yield time, changes
+
+    def blocks(self):
+        """
+        Yield (time, raw bytes) for every timestamp line in the dump.
+
+        The bytes are the value change lines up to the next timestamp,
+        unparsed; see parse_block. Blocks are cut out of large reads with
+        bytes.split, which is much faster than iterating over lines, and
+        lets callers compare whole blocks of two dumps as bytes.
+        """
+        time = 0
+        current = []
+        pending = b""
+        read = self.file.read
+        while True:
+            chunk = read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            # Only split complete lines, keep the rest for the next read
+            data = pending + chunk
+            cut = data.rfind(b"\n") + 1
+            pending = data[cut:]
+            parts = (b"\n" + data[:cut]).split(b"\n#")
+            current.append(parts[0])
+            for part in parts[1:]:
+                yield time, b"".join(current)
+                newline = part.find(b"\n")
+                if newline < 0:
+                    newline = len(part)
+                time = int(part[:newline])
+                self.end_time = time
+                current = [part[newline:]]
+        if pending.startswith(b"#"):
+            yield time, b"".join(current)
+            time = int(pending[1:])
+            self.end_time = time
+        else:
+            current.append(b"\n" + pending)
+        yield time, b"".join(current)
+
+    @staticmethod
+    def parse_block(block):
+        """
+        Parse the value change lines of one block.
+
+        Returns:
+            list: (id code, lowercased value) pairs, bytes
+        """
+        changes = []
+        append = changes.append
+        scalars = _SCALARS
+        if b"\r" in block:
+            block = block.replace(b"\r", b"")
+        for line in block.split(b"\n"):
+            if not line:
+                continue
+            value = scalars.get(line[0])
+            if value is not None:
+                append((line[1:], value))
+            elif line[0] in _VECTORS:
+                value, code = line[1:].split()
+                append((code, value.lower()))
+            elif line[0] in b" \t":
+                changes += VCDReader.parse_block(line.strip())
+            # $dumpvars, $end, $comment and friends carry no values
+        return changes
+
+
+def normalize_value(value, width):
+    """
+    Extend a vector value to its full width.
+
+    VCD writers may drop leading bits; they are 0 if the leftmost bit is
+    0 or 1, and repeat the leftmost bit if it is x or z.
+    """
+    if len(value) >= width:
+        return value
+    first = value[:1]
+    if first in ("x", "z", b"x", b"z"):
+        fill = first
+    else:
+        fill = b"0" if isinstance(value, bytes) else "0"
+    return fill * (width - len(value)) + value
+
+
+def _commands(tokens):
+    """Group header tokens into ($keyword, [arguments]) up to $enddefinitions."""
+    for token in tokens:
+        if not token.startswith(b"$"):
+            continue
+        arguments = []
+        for argument in tokens:
+            if argument == b"$end":
+                break
+            arguments.append(argument)
+        yield token, arguments
+        if token == b"$enddefinitions":
+            return
+
+
+def split_dump(dump_file, instances):
+    """
+    Split a dump into one dump per instance of the top-level scope.
+
+    Each output keeps the timescale and the instance's own scopes, with
+    the instance scope renamed, so it looks like the dump of a
+    simulation with that instance as top level. The input is streamed
+    once and every output only receives the timestamps at which one of
+    its signals changed.
+
+    Args:
+        dump_file: Combined VCD dump
+        instances: Dict of instance label -> (output path, new scope name)
+
+    Returns:
+        dict: Instance label -> number of signals written
+    """
+    labels = {label.lower(): label for label in instances}
+    outputs = {}
+    signal_count = dict.fromkeys(instances, 0)
+    try:
+        for label, (path, _) in instances.items():
+            outputs[label] = open(path, 'wb')
+
+        with open_dump(dump_file) as file:
+            tokens = (token for line in file for token in line.split())
+            # Header: route scopes and vars below each instance scope
+            routes = {}
+            opened = {}
+            scope = []
+            for keyword, arguments in _commands(tokens):
+                if keyword in (b"$timescale", b"$date", b"$version"):
+                    text = b" ".join([keyword] + arguments + [b"$end"]) + b"\n"
+                    for out in outputs.values():
+                        out.write(text)
+                    continue
+                if keyword == b"$scope":
+                    scope.append(arguments[1].decode())
+                elif keyword == b"$upscope" and scope:
+                    scope.pop()
+                # The $upscope closing an instance is written at the end
+                label = labels.get(scope[1].lower()) if len(scope) > 1 else None
+                if label is None:
+                    continue
+                out = outputs[label]
+                if keyword == b"$scope" and len(scope) == 2:
+                    arguments = [arguments[0], instances[label][1].encode()]
+                    opened[label] = True
+                elif keyword == b"$var":
+                    routes.setdefault(arguments[2].decode(), []).append(out)
+                    signal_count[label] += 1
+                out.write(b" ".join([keyword] + arguments + [b"$end"]) + b"\n")
+            for label, out in outputs.items():
+                if opened.get(label):
+                    out.write(b"$upscope $end\n")
+                out.write(b"$enddefinitions $end\n")
+
+            # Value changes
+            stamp = None
+            stamped = set()
+            for line in file:
+                line = line.strip()
+                first = line[:1]
+                if not line or first == b"$":
+                    continue
+                if first == b"#":
+                    stamp = line
+                    stamped.clear()
+                    continue
+                if first in (b"b", b"B", b"r", b"R"):
+                    code = line.split(None, 1)[1].decode()
+                else:
+                    code = line[1:].decode()
+                for out in routes.get(code, ()):
+                    if stamp is not None and id(out) not in stamped:
+                        out.write(stamp + b"\n")
+                        stamped.add(id(out))
+                    out.write(line + b"\n")
+    finally:
+        for out in outputs.values():
+            out.close()
+    return signal_count
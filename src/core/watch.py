@@ -0,0 +1,199 @@
+"""
+File watcher used by watch mode.
+
+Uses inotify on Linux and falls back to mtime polling on other platforms
+or when inotify is unavailable. Bursts of events are debounced and
+reported to the callback as a single set of changed paths.
+"""
+import os
+import sys
+import time
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc():
+    """
+    Load libc with the inotify functions.
+
+    Returns:
+        ctypes.CDLL: libc handle or None if inotify is not available
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """Watches a set of files and calls back with debounced changes."""
+
+    def __init__(self, paths, callback, debounce=0.3, poll_interval=0.5, use_inotify=True):
+        """
+        Args:
+            paths: Iterable of file paths to watch
+            callback: Called with a set of absolute changed paths
+            debounce: Seconds of quiet required before reporting a burst
+            poll_interval: Seconds between stat() rounds in polling mode
+            use_inotify: Set False to force the polling backend
+        """
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._paths = set()
+        self._mtimes = {}
+        self._pending = set()
+        self._last_event = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._libc = _load_libc() if use_inotify else None
+        self._fd = None
+        self._watched_dirs = {}
+
+        self.set_paths(paths)
+
+    @property
+    def backend(self):
+        """Name of the active backend ('inotify' or 'polling')."""
+        return "inotify" if self._libc else "polling"
+
+    def set_paths(self, paths):
+        """
+        Replace the set of watched files.
+
+        Safe to call while the watcher is running, e.g. when the DUT
+        starts using a new component. Paths that stay watched keep their
+        last seen stamp, so a change not yet picked up by the next poll
+        is still reported; only new paths are stat()ed as baseline.
+        """
+        with self._lock:
+            self._paths = {os.path.abspath(p) for p in paths}
+            self._mtimes = {p: self._mtimes[p] if p in self._mtimes else self._stat(p)
+                            for p in self._paths}
+            self._pending &= self._paths
+        if self._fd is not None:
+            self._add_dir_watches()
+
+    def start(self):
+        """Start watching in a daemon thread."""
+        if self._thread:
+            return
+        if self._libc:
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                print("inotify unavailable, falling back to polling.")
+                self._libc = None
+            else:
+                self._fd = fd
+                self._add_dir_watches()
+
+        target = self._run_inotify if self._libc else self._run_polling
+        self._stop.clear()
+        self._thread = threading.Thread(target=target, name="vvtg-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and release the inotify descriptor."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watched_dirs = {}
+
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _add_dir_watches(self):
+        # Watch directories rather than files so editors that save by
+        # rename (vim, most IDEs) are still picked up.
+        with self._lock:
+            dirs = {os.path.dirname(p) for p in self._paths}
+        for d in dirs:
+            if d in self._watched_dirs.values():
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(d), WATCH_MASK)
+            if wd >= 0:
+                self._watched_dirs[wd] = d
+
+    def _mark(self, path):
+        with self._lock:
+            if path not in self._paths:
+                return
+            current = self._stat(path)
+            if current == self._mtimes.get(path):
+                return
+            self._mtimes[path] = current
+            self._pending.add(path)
+            self._last_event = time.monotonic()
+
+    def _flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            if time.monotonic() - self._last_event < self.debounce:
+                return
+            changed = self._pending
+            self._pending = set()
+        try:
+            self.callback(changed)
+        except Exception as e:
+            print(f"ERROR in watch callback: {e}")
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], min(self.debounce, 0.5))
+            if ready:
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    data = b""
+                offset = 0
+                while offset + EVENT_HEADER.size <= len(data):
+                    wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size
+                    name = data[offset:offset + length].rstrip(b"\0")
+                    offset += length
+                    directory = self._watched_dirs.get(wd)
+                    if directory and name:
+                        self._mark(os.path.join(directory, os.fsdecode(name)))
+            self._flush()
+
+    def _run_polling(self):
+        while not self._stop.wait(self.poll_interval):
+            with self._lock:
+                paths = list(self._paths)
+            for path in paths:
+                self._mark(path)
+            self._flush()
@@ -1,8 +1,10 @@
 """GUI components package."""
 from .entries import DurationEntry
 from .wave_gen import WaveGenCanvas
+from .status_panel import StatusPanel
 
 __all__ = [
     'DurationEntry',
-    'WaveGenCanvas'
+    'WaveGenCanvas',
+    'StatusPanel'
 ]
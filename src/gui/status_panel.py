@@ -0,0 +1,76 @@
+import tkinter as tk
+
+from utils.trace import tracer
+
+# Spans shown in the panel, in pipeline order
+STAGES = ["parse", "render", "analyze", "elaborate", "simulate", "viewer", "generate"]
+
+
+class StatusPanel(tk.Frame):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.stage_times = {}
+        self.dump_bytes = None
+        # GUI counters at the previous summary, the panel shows the change
+        self.last_counters = {}
+        self.profile_mode = tk.StringVar(value="off")
+
+        # Timing summary of the last run
+        self.text = tk.StringVar(value="No run yet")
+        self.label = tk.Label(self, textvariable=self.text, justify="left", font=("Courier", 9))
+        self.label.pack(anchor="w")
+
+        button_frame = tk.Frame(self)
+        button_frame.pack(anchor="w", pady=5)
+
+        tk.Button(button_frame, text="Export Trace", command=self.export_trace).pack(side="left")
+        tk.Label(button_frame, text="Profile :").pack(side="left", padx=(10, 0))
+        tk.OptionMenu(button_frame, self.profile_mode, "off", "cprofile", "tracemalloc").pack(side="left")
+
+        tracer.add_listener(self.on_span)
+
+    def destroy(self):
+        tracer.remove_listener(self.on_span)
+        super().destroy()
+
+    def on_span(self, event):
+        name = event['name']
+        if name == "simulate":
+            self.dump_bytes = event['args'].get('dump_bytes')
+        # Several analyze spans per run are summed
+        self.stage_times[name] = self.stage_times.get(name, 0) + event['dur'] / 1000
+        if name == "generate":
+            # End of a run, show it and start collecting the next one
+            summary = self.stage_times, self.dump_bytes
+            self.stage_times = {}
+            self.dump_bytes = None
+            self.after_idle(self.refresh, *summary)
+
+    def refresh(self, stage_times, dump_bytes):
+        lines = [f"{stage:<10}{stage_times[stage]:>10.1f} ms"
+                 for stage in STAGES if stage in stage_times]
+        if dump_bytes is not None:
+            lines.append(f"{'dump':<10}{dump_bytes / 1024:>10.1f} KiB")
+        # Canvas work since the previous run (edits, zoom and this run)
+        counters = dict(tracer.counters)
+        delta = {name: counters.get(name, 0) - self.last_counters.get(name, 0)
+                 for name in ("gui.redraw.wave", "gui.redraw.overlay", "gui.items.wave", "gui.items.overlay")}
+        self.last_counters = counters
+        redraws = delta["gui.redraw.wave"] + delta["gui.redraw.overlay"]
+        items = delta["gui.items.wave"] + delta["gui.items.overlay"]
+        lines.append("since last run:")
+        lines.append(f"{'redraws':<10}{redraws:>10}")
+        lines.append(f"{'items':<10}{items:>10}")
+        self.text.set("\n".join(lines))
+
+    def export_trace(self):
+        from tkinter import filedialog
+
+        filename = filedialog.asksaveasfilename(
+            title="Export Chrome Trace",
+            defaultextension=".json",
+            filetypes=[("Trace files", "*.json"), ("All files", "*.*")]
+        )
+        if filename:
+            tracer.export_chrome_trace(filename)
@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from utils.trace import count
+
 class WaveGenCanvas(tk.Frame):
     def __init__(self, parent, high_ns, low_ns, test_ns, segment_ns, num_overlays=None, data_types=None, pixels_per_ns=4, **kwargs):
         super().__init__(parent, **kwargs)
@@ -14,6 +16,7 @@ class WaveGenCanvas(tk.Frame):
         self.data_types = data_types
 
         self.overlay_canvases = []
+        self.name_labels = []
         self.highlighted_segments = [[] for _ in range(len(self.num_overlays))]
         self.highlighted_segments_values = [{} for _ in range(len(self.num_overlays))]
 
@@ -47,6 +50,7 @@ class WaveGenCanvas(tk.Frame):
             line_frame.pack(fill="x", expand=True)
             name_label = tk.Label(line_frame, text=num_overlays[i], width=20)
             name_label.pack(side="left")
+            self.name_labels.append(name_label)
             overlay = tk.Canvas(line_frame, height=self.canvas_height, bg="black",
                                 xscrollcommand=self.scrollbar_x.set)
             overlay.pack(fill="x", expand=True)
@@ -64,6 +68,8 @@ class WaveGenCanvas(tk.Frame):
         canvas_width = int(self.test_ns * self.pixels_per_ns)
         self.canvas.config(scrollregion=(0, 0, canvas_width, self.canvas_height))
 
+        count("gui.redraw.wave")
+        items = 0
         x = 0
         while x < canvas_width:
             low_width = int(self.low_ns * self.pixels_per_ns)
@@ -75,13 +81,14 @@ class WaveGenCanvas(tk.Frame):
             self.canvas.create_rectangle(x, 4, x + high_width, self.canvas_height, fill="green",
                                          outline="green")
             x += high_width
+            items += 2
+        count("gui.items.wave", items)
 
     def draw_all_overlays(self):
         for i in range(len(self.num_overlays)):
             if self.data_types[i] == 'STD_LOGIC':
                 self.draw_overlay(i)
             else:
-                print(self.highlighted_segments_values[i])
                 self.draw_overlay(i, self.highlighted_segments_values[i])
 
     def draw_overlay(self, index, label_dict=None):
@@ -89,7 +96,9 @@ class WaveGenCanvas(tk.Frame):
         canvas.delete("all")
         canvas_width = int(self.test_ns * self.pixels_per_ns)
         canvas.config(scrollregion=(0, 0, canvas_width, self.canvas_height))
+        count("gui.redraw.overlay")
 
+        items = 0
         for segment_index in self.highlighted_segments[index]:
             segment_start_ns = segment_index * self.segment_ns
             segment_start_x = int(segment_start_ns * self.pixels_per_ns)
@@ -101,6 +110,7 @@ class WaveGenCanvas(tk.Frame):
                 segment_start_x + segment_width, self.canvas_height,
                 fill="blue", outline=""
             )
+            items += 1
 
             # If label_dict is provided and has a label for this segment
             if label_dict and segment_index in label_dict:
@@ -110,6 +120,8 @@ class WaveGenCanvas(tk.Frame):
                     text=label_dict[segment_index],
                     fill="white"
                 )
+                items += 1
+        count("gui.items.overlay", items)
 
     def on_click(self, event, overlay_index):
         canvas = self.overlay_canvases[overlay_index]
@@ -126,8 +138,8 @@ class WaveGenCanvas(tk.Frame):
                 self.highlighted_segments[overlay_index].append(segment_index)
             else:
                 self.open_popup(overlay_index, self.data_types[overlay_index], segment_index)
-        print(self.highlighted_segments_values)
-        self.draw_overlay(overlay_index)
+        count("gui.click")
+        self.draw_overlay(overlay_index, self.highlighted_segments_values[overlay_index])
 
     def zoom_in(self):
         self.pixels_per_ns *= 2
@@ -144,6 +156,29 @@ class WaveGenCanvas(tk.Frame):
         for overlay in self.overlay_canvases:
             overlay.xview(*args)
 
+    def set_stimulus(self, segments, values):
+        self.highlighted_segments = [list(s) for s in segments]
+        self.highlighted_segments_values = [dict(v) for v in values]
+        self.draw_all_overlays()
+
+    def set_coverage(self, untoggled):
+        """
+        Mark ports whose bits did not toggle in the last simulation.
+
+        untoggled holds one list of bit numbers (LSB = 0) per overlay, or
+        None where no coverage is known; empty lists clear the mark.
+        """
+        for i, label in enumerate(self.name_labels):
+            bits = untoggled[i] if i < len(untoggled) else None
+            if not bits:
+                label.config(text=self.num_overlays[i], fg="black")
+            elif self.data_types[i] == 'STD_LOGIC':
+                label.config(text=f"{self.num_overlays[i]} (no toggle)", fg="red")
+            else:
+                # The label is narrow, long lists are in the console report
+                shown = f"bits {','.join(map(str, bits))}" if len(bits) <= 4 else f"{len(bits)} bits"
+                label.config(text=f"{self.num_overlays[i]} ({shown})", fg="red")
+
     def get_highlighted_segments(self):
         return self.highlighted_segments
 
@@ -157,7 +192,6 @@ class WaveGenCanvas(tk.Frame):
         self.highlighted_segments_values[overlay_index][segment_index] = result
         self.highlighted_segments[overlay_index].append(segment_index)
         self.draw_overlay(overlay_index, self.highlighted_segments_values[overlay_index])
-        print(self.highlighted_segments_values)
 
 
 class PopupWindow:
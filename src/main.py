@@ -2,12 +2,104 @@
 VHDL Testbench Generator - Main Entry Point
 
 """
-from app_gui import VHDLTestbenchGUI
 import sys
+import argparse
 
-file_path = sys.argv[1] if len(sys.argv) > 1 else None
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Visual VHDL Testbench Generator")
+    parser.add_argument("file_path", nargs="?", default=None, help="VHDL component file")
+    parser.add_argument("--headless", action="store_true", help="run without a window")
+    parser.add_argument("--watch", action="store_true",
+                        help="regenerate and re-simulate when the component files change")
+    parser.add_argument("--stimulus", default=None, help="JSON stimulus file (headless only)")
+    parser.add_argument("--simulator", choices=["auto", "ghdl", "nvc"], default=None,
+                        help="simulator to use, overrides the project's vvtg.json")
+    parser.add_argument("--stimulus-style", choices=["unrolled", "delta", "table"], default=None,
+                        help="how the stimulus process is emitted, overrides vvtg.json")
+    parser.add_argument("--dump-format", choices=["ghw", "vcd", "fst"], default=None,
+                        help="waveform format (default: the simulator's native one)")
+    parser.add_argument("--save-golden", action="store_true",
+                        help="store this run's waveform as the golden reference (headless)")
+    parser.add_argument("--check-golden", action="store_true",
+                        help="compare each run's waveform with the golden reference")
+    parser.add_argument("--coverage", action="store_true",
+                        help="report toggle and value coverage of the ports after each run")
+    parser.add_argument("--batch", nargs="+", default=None, metavar="FILE",
+                        help="simulate many DUTs in one simulator run (each with <name>.stim.json)")
+    parser.add_argument("--batch-dir", default=None, help="work directory of the batch run")
+    parser.add_argument("--rescan-tools", action="store_true", help="ignore the cached GHDL/GTKWave paths")
+    parser.add_argument("--daemon", action="store_true", help="run the generation daemon (job API)")
+    parser.add_argument("--port", type=int, default=8765, help="daemon TCP port on localhost")
+    parser.add_argument("--socket", default=None, help="daemon Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=2, help="daemon jobs running at the same time")
+    parser.add_argument("--library", action="append", default=[], metavar="NAME=DIR",
+                        help="shared VHDL library analyzed once by the daemon or batch run")
+    parser.add_argument("--trace", default=None, metavar="FILE",
+                        help="write a Chrome trace-event JSON file on exit")
+    parser.add_argument("--profile", choices=["cprofile", "tracemalloc"], default=None,
+                        help="profile the headless run")
+    parser.add_argument("--measure-startup", action="store_true",
+                        help="print the time to first window and exit")
+    return parser.parse_args()
+
+
+def main(args):
+    if args.daemon:
+        from app_daemon import GenerationDaemon, serve
+        libraries = dict(lib.split("=", 1) for lib in args.library)
+        daemon = GenerationDaemon(workers=args.workers, libraries=libraries,
+                                  simulator=args.simulator or "auto")
+        serve(daemon, port=args.port, socket_path=args.socket)
+    elif args.batch:
+        from app_batch import BatchRunner
+        libraries = dict(lib.split("=", 1) for lib in args.library)
+        runner = BatchRunner(args.batch, work_dir=args.batch_dir, libraries=libraries)
+        runner.simulator_override = args.simulator
+        runner.stimulus_style = args.stimulus_style
+        runner.check_golden = args.check_golden
+        runner.collect_coverage = args.coverage
+        return runner.run()
+    elif args.headless:
+        from app_headless import HeadlessRunner
+        runner = HeadlessRunner(args.file_path, stimulus_path=args.stimulus, save_golden=args.save_golden)
+        runner.logic.simulator_override = args.simulator
+        runner.logic.stimulus_style = args.stimulus_style
+        runner.logic.dump_format = args.dump_format or ("vcd" if args.save_golden else None)
+        runner.logic.check_golden = args.check_golden
+        runner.logic.collect_coverage = args.coverage
+        if args.rescan_tools:
+            runner.logic.refresh_tools()
+        if args.watch:
+            return runner.watch()
+        elif args.profile:
+            from utils.trace import profile_call
+            return profile_call(runner.run_once, args.profile, output="generate.prof")
+        else:
+            return runner.run_once()
+    else:
+        from app_gui import VHDLTestbenchGUI
+        app = VHDLTestbenchGUI(file_path=args.file_path, watch=args.watch,
+                               measure_startup=args.measure_startup)
+        app.logic.simulator_override = args.simulator
+        app.logic.stimulus_style = args.stimulus_style
+        app.logic.dump_format = args.dump_format
+        app.check_golden.set(args.check_golden)
+        app.logic.check_golden = args.check_golden
+        app.collect_coverage.set(args.coverage)
+        app.logic.collect_coverage = args.coverage
+        if args.rescan_tools:
+            app.logic.refresh_tools()
+        app.run()
+    return True
 
 
 if __name__ == "__main__":
-    app = VHDLTestbenchGUI(file_path=file_path)
-    app.run()
\ No newline at end of file
+    args = parse_args()
+    try:
+        ok = main(args)
+    finally:
+        if args.trace:
+            from utils.trace import export_chrome_trace
+            export_chrome_trace(args.trace)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,74 @@
+"""
+User-level configuration and cache files.
+"""
+import os
+import sys
+import json
+
+
+def get_config_dir():
+    """
+    Get the per-user directory for VVTG configuration and caches.
+
+    Returns:
+        str: Absolute path, created if missing
+    """
+    if sys.platform.startswith("win"):
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(root, "vvtg")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_json(file_name, default=None):
+    """
+    Read a JSON file from the config directory.
+
+    Returns:
+        The decoded content, or default if missing or unreadable
+    """
+    try:
+        with open(os.path.join(get_config_dir(), file_name), 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(file_name, data):
+    """
+    Atomically write a JSON file to the config directory.
+    """
+    path = os.path.join(get_config_dir(), file_name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not write {path}: {e}")
+
+
+PROJECT_FILE = "vvtg.json"
+
+
+def load_project_config(project_dir):
+    """
+    Read the per-project settings file next to the DUT.
+
+    Example vvtg.json::
+
+        {"simulator": "nvc", "std": "08", "optimize": 2}
+
+    Returns:
+        dict: Project settings, empty if there is no settings file
+    """
+    try:
+        with open(os.path.join(project_dir, PROJECT_FILE), 'r') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring invalid {PROJECT_FILE}: {e}")
+        return {}
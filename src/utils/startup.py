@@ -0,0 +1,58 @@
+"""
+Startup time measurement.
+
+Time is measured from process creation as reported by the OS, so
+interpreter start-up and module imports are included. A onefile build
+runs Python in a child of the bootloader; its unpacking time shows up
+as the difference to the wall time measured from outside.
+"""
+import os
+import sys
+import time
+
+# Fallback reference if the OS cannot tell us when the process started
+_IMPORT_TIME = time.time()
+
+
+def process_start_time():
+    """
+    Get the wall-clock time at which this process was created.
+
+    Returns:
+        float: Seconds since the epoch
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat", 'r') as file:
+                # Field 22 is starttime in clock ticks since boot; the
+                # command name (field 2) may contain spaces, skip past it
+                fields = file.read().rsplit(')', 1)[1].split()
+            start_ticks = int(fields[19])
+            # Not btime from /proc/stat, which is rounded to whole seconds
+            since_start = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+            return time.time() - since_start
+
+        if sys.platform.startswith("win"):
+            import ctypes
+            from ctypes import wintypes
+            creation = wintypes.FILETIME()
+            dummy = wintypes.FILETIME()
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            ok = ctypes.windll.kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(dummy),
+                                                        ctypes.byref(dummy), ctypes.byref(dummy))
+            if ok:
+                ticks = (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+                # FILETIME counts 100 ns intervals since 1601-01-01
+                return ticks / 1e7 - 11644473600
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    return _IMPORT_TIME
+
+
+def elapsed_since_start():
+    """
+    Returns:
+        float: Seconds elapsed since process creation
+    """
+    return time.time() - process_start_time()
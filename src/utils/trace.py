@@ -0,0 +1,163 @@
+"""
+Lightweight pipeline instrumentation.
+
+Timing spans and counters are recorded in memory and can be exported
+in the Chrome trace-event format (load in chrome://tracing or Perfetto).
+
+    with span("analyze", file="my_register.vhd"):
+        ...
+    count("gui.redraw")
+    export_chrome_trace("trace.json")
+"""
+import os
+import json
+import time
+import threading
+from collections import deque
+
+
+class Tracer:
+    """Collects spans and counters. Thread-safe."""
+
+    def __init__(self, max_events=100000):
+        self.events = deque(maxlen=max_events)
+        self.counters = {}
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._listeners = []
+
+    def span(self, name, **args):
+        """Context manager timing a block; extra args are attached to the event."""
+        return _Span(self, name, args)
+
+    def count(self, name, value=1):
+        """Add value to a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            total = self.counters[name]
+            self.events.append({
+                'name': name, 'ph': 'C', 'ts': self._now_us(),
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': {'value': total},
+            })
+
+    def add_listener(self, callback):
+        """Call callback(event) for every completed span."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self.counters = {}
+
+    def spans(self, name=None):
+        """
+        Returns:
+            list: Completed span events, optionally filtered by name
+        """
+        with self._lock:
+            return [e for e in self.events if e['ph'] == 'X' and (name is None or e['name'] == name)]
+
+    def export_chrome_trace(self, file_path):
+        """Write all events as a Chrome trace-event JSON file."""
+        with self._lock:
+            data = {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+        with open(file_path, 'w') as file:
+            json.dump(data, file)
+        print(f"Trace written: {file_path}")
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _record(self, event):
+        with self._lock:
+            self.events.append(event)
+        for callback in list(self._listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"ERROR in trace listener: {e}")
+
+
+class _Span:
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.tracer._now_us()
+        return self
+
+    def set(self, **args):
+        """Attach more args once they are known (e.g. output size)."""
+        self.args.update(args)
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.tracer.enabled:
+            return False
+        if exc_type:
+            self.args['error'] = str(exc)
+        self.tracer._record({
+            'name': self.name, 'cat': 'pipeline', 'ph': 'X',
+            'ts': self.start, 'dur': self.tracer._now_us() - self.start,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+# Process-wide tracer used by the pipeline and the GUI
+tracer = Tracer()
+span = tracer.span
+count = tracer.count
+export_chrome_trace = tracer.export_chrome_trace
+
+
+def profile_call(func, mode="cprofile", output=None):
+    """
+    Run func once under cProfile or tracemalloc.
+
+    Args:
+        func: Callable without arguments
+        mode: 'cprofile' or 'tracemalloc'
+        output: For cprofile, path of a .prof file to write (optional)
+
+    Returns:
+        The return value of func
+    """
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func)
+        finally:
+            if output:
+                profiler.dump_stats(output)
+                print(f"Profile written: {output}")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+    if mode == "tracemalloc":
+        import tracemalloc
+
+        tracemalloc.start()
+        try:
+            return func()
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB")
+            for stat in snapshot.statistics("lineno")[:10]:
+                print(f"  {stat}")
+
+    raise ValueError(f"Unknown profile mode '{mode}'")